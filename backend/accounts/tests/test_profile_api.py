@@ -7,7 +7,8 @@ from django.contrib.auth import get_user_model
 from django.urls import reverse
 from rest_framework.test import APITestCase
 from rest_framework import status
-from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts.tests.utils import auth_header_for
 
 User = get_user_model()
 
@@ -23,8 +24,7 @@ class UserProfileAPITests(APITestCase):
             first_name='Test',
             last_name='User'
         )
-        self.token = RefreshToken.for_user(self.user).access_token
-        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.token}')
+        self.client.credentials(HTTP_AUTHORIZATION=auth_header_for(self.user))
 
     def test_get_user_profile(self):
         """Test retrieving user profile"""
@@ -127,8 +127,7 @@ class UserPreferencesTests(APITestCase):
             username='testuser',
             password='testpass123'
         )
-        self.token = RefreshToken.for_user(self.user).access_token
-        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.token}')
+        self.client.credentials(HTTP_AUTHORIZATION=auth_header_for(self.user))
 
     def test_update_cv_template_preference(self):
         """Test updating preferred CV template"""
@@ -0,0 +1,16 @@
+"""
+Shared authentication helpers for API tests
+"""
+
+from rest_framework_simplejwt.tokens import AccessToken
+
+# Bearer headers keyed by user id, reused for the whole test process. An access
+# token only carries the user id, so it stays valid for any user with that pk.
+_auth_headers = {}
+
+
+def auth_header_for(user):
+    """Return an Authorization header value for the user, signing it only once"""
+    if user.pk not in _auth_headers:
+        _auth_headers[user.pk] = f'Bearer {AccessToken.for_user(user)}'
+    return _auth_headers[user.pk]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:26
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('artifacts', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='artifact',
+            index=models.Index(fields=['user', '-updated_at'], name='artifacts_a_user_id_6ae9e0_idx'),
+        ),
+    ]
@@ -42,6 +42,9 @@ class Artifact(models.Model):
 
     class Meta:
         ordering = ['-updated_at']
+        indexes = [
+            models.Index(fields=['user', '-updated_at']),  # per-user artifact listing
+        ]
 
     def __str__(self):
         return f"{self.title} ({self.user.email})"
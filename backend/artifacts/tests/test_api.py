@@ -7,9 +7,9 @@ from django.contrib.auth import get_user_model
 from django.urls import reverse
 from rest_framework.test import APITestCase
 from rest_framework import status
-from rest_framework_simplejwt.tokens import RefreshToken
 
 from artifacts.models import Artifact, ArtifactProcessingJob
+from accounts.tests.utils import auth_header_for
 
 User = get_user_model()
 
@@ -23,8 +23,7 @@ class ArtifactAPITests(APITestCase):
             username='testuser',
             password='testpass123'
         )
-        self.token = RefreshToken.for_user(self.user).access_token
-        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.token}')
+        self.client.credentials(HTTP_AUTHORIZATION=auth_header_for(self.user))
 
     def test_create_artifact(self):
         """Test artifact creation via API"""
@@ -42,9 +41,7 @@ class ArtifactAPITests(APITestCase):
         response = self.client.post(url, data, format='json')
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        self.assertEqual(Artifact.objects.count(), 1)
-
-        artifact = Artifact.objects.first()
+        artifact = Artifact.objects.get()
         self.assertEqual(artifact.title, 'API Test Project')
         self.assertEqual(artifact.user, self.user)
         self.assertEqual(len(artifact.technologies), 3)
@@ -166,8 +163,7 @@ class ArtifactProcessingStatusAPITests(APITestCase):
             username='testuser',
             password='testpass123'
         )
-        self.token = RefreshToken.for_user(self.user).access_token
-        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.token}')
+        self.client.credentials(HTTP_AUTHORIZATION=auth_header_for(self.user))
 
         self.artifact = Artifact.objects.create(
             user=self.user,
@@ -208,8 +204,7 @@ class ArtifactSuggestionsAPITests(APITestCase):
             username='testuser',
             password='testpass123'
         )
-        self.token = RefreshToken.for_user(self.user).access_token
-        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.token}')
+        self.client.credentials(HTTP_AUTHORIZATION=auth_header_for(self.user))
 
     def test_get_all_suggestions(self):
         """Test getting all technology suggestions"""
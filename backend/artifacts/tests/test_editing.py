@@ -3,12 +3,12 @@ from django.contrib.auth import get_user_model
 from django.urls import reverse
 from rest_framework.test import APITestCase
 from rest_framework import status
-from rest_framework_simplejwt.tokens import RefreshToken
 from artifacts.models import Artifact, EvidenceLink, UploadedFile
 from artifacts.serializers import (
     ArtifactUpdateSerializer, EvidenceLinkCreateSerializer,
     EvidenceLinkUpdateSerializer, BulkArtifactUpdateSerializer
 )
+from accounts.tests.utils import auth_header_for
 
 User = get_user_model()
 
@@ -26,10 +26,7 @@ class ArtifactEditingAPITestCase(APITestCase):
             password='testpassword'
         )
 
-        # Create JWT token
-        refresh = RefreshToken.for_user(self.user)
-        self.access_token = str(refresh.access_token)
-        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.access_token}')
+        self.client.credentials(HTTP_AUTHORIZATION=auth_header_for(self.user))
 
         # Create test artifacts
         self.artifact = Artifact.objects.create(
@@ -123,8 +120,7 @@ class ArtifactEditingAPITestCase(APITestCase):
         response = self.client.post(url, data, format='json')
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        self.assertEqual(EvidenceLink.objects.count(), 1)
-        evidence_link = EvidenceLink.objects.first()
+        evidence_link = EvidenceLink.objects.get()
         self.assertEqual(evidence_link.artifact, self.artifact)
         self.assertEqual(evidence_link.url, 'https://github.com/user/project')
         self.assertEqual(evidence_link.link_type, 'github')
@@ -0,0 +1,26 @@
+"""
+Django settings for running the test suite.
+
+Selected explicitly (pytest's DJANGO_SETTINGS_MODULE, or
+`manage.py test --settings=cv_tailor.settings_test`), never inferred at runtime.
+"""
+
+from .settings import *  # noqa: F401,F403
+
+# Tests create many users; PBKDF2 hashing dominates their setup time
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
+
+# Tests that exercise caching override this with a locmem cache
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+    }
+}
+
+# Run tasks in-process instead of going through a broker
+CELERY_TASK_ALWAYS_EAGER = True
+CELERY_TASK_EAGER_PROPAGATES = True
+CELERY_BROKER_URL = 'memory://'
+CELERY_RESULT_BACKEND = 'cache+memory://'
@@ -0,0 +1,48 @@
+"""
+Tests for project-level API plumbing.
+"""
+
+import json
+import uuid
+from datetime import date, datetime, timezone as dt_timezone
+from decimal import Decimal
+
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.serializer_helpers import ReturnDict
+
+from .renderers import ORJSONRenderer
+
+
+class ORJSONRendererTests(SimpleTestCase):
+    def test_matches_drf_json_renderer(self):
+        """Test orjson output is byte-identical to DRF's JSONRenderer"""
+        data = ReturnDict({
+            'id': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+            'created_at': datetime(2025, 1, 2, 3, 4, 5, 678901, tzinfo=dt_timezone.utc),
+            'date': date(2025, 1, 2),
+            'cost': Decimal('0.0125'),
+            'label': gettext_lazy('Completed'),
+            'scores': [0.1, 2.5, None, True],
+            'counts': {1: 'one'},
+            'text': 'caf\u00e9 \u2028 line',
+        }, serializer=None)
+
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_exponent_floats_parse_identically(self):
+        """Test floats orjson writes in shorter exponent form decode to the same values"""
+        data = {'scores': [2.5e-07, 1e+22, 0.30000000000000004]}
+
+        self.assertEqual(json.loads(ORJSONRenderer().render(data)), json.loads(JSONRenderer().render(data)))
+
+    def test_indented_and_empty_responses(self):
+        """Test indent requests fall back to JSONRenderer and None renders empty"""
+        renderer = ORJSONRenderer()
+
+        self.assertEqual(renderer.render(None), b'')
+        self.assertEqual(
+            renderer.render({'a': 1}, 'application/json; indent=2'),
+            JSONRenderer().render({'a': 1}, 'application/json; indent=2'),
+        )
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:26
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('export', '0001_initial'),
+        ('generation', '0003_generateddocument_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='exportjob',
+            index=models.Index(fields=['user', '-created_at'], name='export_expo_user_id_558b3f_idx'),
+        ),
+    ]
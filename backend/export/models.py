@@ -71,6 +71,9 @@ class ExportJob(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', '-created_at']),  # per-user export listing
+        ]
 
     def __str__(self):
         return f"{self.format.upper()} export for {self.user.email} - {self.status}"
@@ -2,15 +2,14 @@
 Pytest configuration and fixtures for export app tests
 """
 
-import uuid
-from datetime import datetime, timedelta
+from datetime import timedelta
 import pytest
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 from rest_framework.test import APIClient
 from rest_framework_simplejwt.tokens import RefreshToken
 
-from export.models import ExportJob, ExportTemplate, ExportAnalytics
+from export.models import ExportJob, ExportTemplate
 from generation.models import GeneratedDocument, JobDescription
 
 User = get_user_model()
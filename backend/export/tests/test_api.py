@@ -4,43 +4,60 @@ Unit tests for export app API endpoints
 
 import uuid
 from unittest.mock import patch, Mock
-from datetime import datetime, timedelta
-from django.test import TestCase
+from datetime import timedelta
 from django.contrib.auth import get_user_model
-from django.urls import reverse
+from django.urls import reverse, reverse_lazy
 from django.utils import timezone
 from rest_framework.test import APITestCase
 from rest_framework import status
-from rest_framework_simplejwt.tokens import RefreshToken
 
 from export.models import ExportJob, ExportTemplate, ExportAnalytics
 from generation.models import GeneratedDocument, JobDescription
+from accounts.tests.utils import auth_header_for
 
 User = get_user_model()
 
+# Static endpoints are resolved once; the lazy proxies render on first use
+USER_EXPORTS_URL = reverse_lazy('user_exports_list')
+TEMPLATES_URL = reverse_lazy('export_templates_list')
+ANALYTICS_URL = reverse_lazy('export_analytics')
+
+
+def export_url(generation_id):
+    return reverse('export_document', kwargs={'generation_id': generation_id})
+
+
+def status_url(export_id):
+    return reverse('export_status', kwargs={'export_id': export_id})
+
+
+def download_url(export_id):
+    return reverse('download_export', kwargs={'export_id': export_id})
+
 
 class ExportAPITests(APITestCase):
     """Test cases for Export API endpoints"""
 
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             email='test@example.com',
             username='testuser',
             password='testpass123'
         )
-        self.token = RefreshToken.for_user(self.user).access_token
-        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.token}')
+        # Sign once per class; setUp only attaches the header string
+        cls.auth_header = auth_header_for(cls.user)
 
         # Create test data
-        self.job_desc = JobDescription.objects.create(
+        cls.job_desc = JobDescription.objects.create(
             content_hash='abc123',
             raw_content='Test job description'
         )
-        self.generated_doc = GeneratedDocument.objects.create(
-            user=self.user,
+        cls.generated_doc = GeneratedDocument.objects.create(
+            user=cls.user,
             document_type='cv',
             job_description_hash='abc123',
-            job_description=self.job_desc,
+            job_description=cls.job_desc,
             status='completed',
             content={
                 'professional_summary': 'Experienced developer',
@@ -54,17 +71,20 @@ class ExportAPITests(APITestCase):
                 ]
             }
         )
-        self.template = ExportTemplate.objects.create(
+        cls.template = ExportTemplate.objects.create(
             name='Test Template',
             category='modern',
             description='Test template',
             is_active=True
         )
 
+    def setUp(self):
+        self.client.credentials(HTTP_AUTHORIZATION=self.auth_header)
+
     @patch('export.tasks.export_document_task.delay')
     def test_export_document_pdf(self, mock_task):
         """Test PDF export request"""
-        url = reverse('export_document', kwargs={'generation_id': self.generated_doc.id})
+        url = export_url(self.generated_doc.id)
         data = {
             'format': 'pdf',
             'template_id': self.template.id,
@@ -86,9 +106,8 @@ class ExportAPITests(APITestCase):
         self.assertIn('export_id', response.data)
         self.assertEqual(response.data['status'], 'processing')
 
-        # Check that export job was created
-        self.assertEqual(ExportJob.objects.count(), 1)
-        export_job = ExportJob.objects.first()
+        # Check that exactly one export job was created
+        export_job = ExportJob.objects.get()
         self.assertEqual(export_job.format, 'pdf')
         self.assertEqual(export_job.template, self.template)
 
@@ -99,7 +118,7 @@ class ExportAPITests(APITestCase):
     @patch('export.tasks.export_document_task.delay')
     def test_export_document_docx(self, mock_export_task, mock_validate_task):
         """Test DOCX export request"""
-        url = reverse('export_document', kwargs={'generation_id': self.generated_doc.id})
+        url = export_url(self.generated_doc.id)
         data = {
             'format': 'docx',
             'template_id': self.template.id,
@@ -121,7 +140,7 @@ class ExportAPITests(APITestCase):
             print(f"Status code: {response.status_code}")
         self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
 
-        export_job = ExportJob.objects.first()
+        export_job = ExportJob.objects.get()
         self.assertEqual(export_job.format, 'docx')
         self.assertTrue(export_job.export_options['options']['include_evidence'])
 
@@ -132,7 +151,7 @@ class ExportAPITests(APITestCase):
     def test_export_document_not_found(self):
         """Test export request for non-existent generation"""
         fake_id = str(uuid.uuid4())
-        url = reverse('export_document', kwargs={'generation_id': fake_id})
+        url = export_url(fake_id)
         data = {'format': 'pdf'}
 
         response = self.client.post(url, data, format='json')
@@ -150,7 +169,7 @@ class ExportAPITests(APITestCase):
             file_size=2048
         )
 
-        url = reverse('export_status', kwargs={'export_id': export_job.id})
+        url = status_url(export_job.id)
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -161,7 +180,7 @@ class ExportAPITests(APITestCase):
     def test_export_status_not_found(self):
         """Test export status for non-existent export"""
         fake_id = str(uuid.uuid4())
-        url = reverse('export_status', kwargs={'export_id': fake_id})
+        url = status_url(fake_id)
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -186,7 +205,7 @@ class ExportAPITests(APITestCase):
             expires_at=timezone.now() + timedelta(hours=1)
         )
 
-        url = reverse('download_export', kwargs={'export_id': export_job.id})
+        url = download_url(export_job.id)
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, 200)
@@ -214,7 +233,7 @@ class ExportAPITests(APITestCase):
             format='docx'
         )
 
-        url = reverse('user_exports_list')
+        url = USER_EXPORTS_URL
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -224,38 +243,28 @@ class ExportAPITests(APITestCase):
 class ExportTemplateAPITests(APITestCase):
     """Test cases for Export Template API"""
 
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             email='test@example.com',
             username='testuser',
             password='testpass123'
         )
-        self.token = RefreshToken.for_user(self.user).access_token
-        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.token}')
+        cls.auth_header = auth_header_for(cls.user)
 
         # Create test templates
-        ExportTemplate.objects.create(
-            name='Modern',
-            category='modern',
-            description='Modern template',
-            is_active=True
-        )
-        ExportTemplate.objects.create(
-            name='Classic',
-            category='classic',
-            description='Classic template',
-            is_active=True
-        )
-        ExportTemplate.objects.create(
-            name='Inactive',
-            category='modern',
-            description='Inactive template',
-            is_active=False
-        )
+        ExportTemplate.objects.bulk_create([
+            ExportTemplate(name='Modern', category='modern', description='Modern template', is_active=True),
+            ExportTemplate(name='Classic', category='classic', description='Classic template', is_active=True),
+            ExportTemplate(name='Inactive', category='modern', description='Inactive template', is_active=False),
+        ])
+
+    def setUp(self):
+        self.client.credentials(HTTP_AUTHORIZATION=self.auth_header)
 
     def test_list_active_templates(self):
         """Test listing only active templates"""
-        url = reverse('export_templates_list')
+        url = TEMPLATES_URL
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -270,55 +279,60 @@ class ExportTemplateAPITests(APITestCase):
 class ExportAnalyticsAPITests(APITestCase):
     """Test cases for export analytics API"""
 
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             email='test@example.com',
             username='testuser',
             password='testpass123'
         )
-        self.token = RefreshToken.for_user(self.user).access_token
-        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.token}')
+        cls.auth_header = auth_header_for(cls.user)
 
-        self.generated_doc = GeneratedDocument.objects.create(
-            user=self.user,
+        cls.generated_doc = GeneratedDocument.objects.create(
+            user=cls.user,
             document_type='cv',
             job_description_hash='abc123'
         )
 
-        self.template = ExportTemplate.objects.create(
+        cls.template = ExportTemplate.objects.create(
             name='Test Template',
             category='modern',
             description='Test template'
         )
 
         # Create test exports
-        ExportJob.objects.create(
-            user=self.user,
-            generated_document=self.generated_doc,
-            format='pdf',
-            template=self.template,
-            status='completed',
-            download_count=2,
-            file_size=2048
-        )
-        ExportJob.objects.create(
-            user=self.user,
-            generated_document=self.generated_doc,
-            format='docx',
-            status='completed',
-            download_count=1,
-            file_size=1024
-        )
-        ExportJob.objects.create(
-            user=self.user,
-            generated_document=self.generated_doc,
-            format='pdf',
-            status='failed'
-        )
+        ExportJob.objects.bulk_create([
+            ExportJob(
+                user=cls.user,
+                generated_document=cls.generated_doc,
+                format='pdf',
+                template=cls.template,
+                status='completed',
+                download_count=2,
+                file_size=2048
+            ),
+            ExportJob(
+                user=cls.user,
+                generated_document=cls.generated_doc,
+                format='docx',
+                status='completed',
+                download_count=1,
+                file_size=1024
+            ),
+            ExportJob(
+                user=cls.user,
+                generated_document=cls.generated_doc,
+                format='pdf',
+                status='failed'
+            ),
+        ])
+
+    def setUp(self):
+        self.client.credentials(HTTP_AUTHORIZATION=self.auth_header)
 
     def test_export_analytics(self):
         """Test export analytics endpoint"""
-        url = reverse('export_analytics')
+        url = ANALYTICS_URL
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -340,50 +354,50 @@ class ExportAnalyticsAPITests(APITestCase):
 class ExportAuthorizationTests(APITestCase):
     """Test authorization and user isolation for export endpoints"""
 
-    def setUp(self):
-        self.user1 = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user1 = User.objects.create_user(
             email='user1@example.com',
             username='user1',
             password='password123'
         )
-        self.user2 = User.objects.create_user(
+        cls.user2 = User.objects.create_user(
             email='user2@example.com',
             username='user2',
             password='password123'
         )
 
-        self.doc1 = GeneratedDocument.objects.create(
-            user=self.user1,
+        cls.doc1 = GeneratedDocument.objects.create(
+            user=cls.user1,
             document_type='cv',
             job_description_hash='abc123',
             status='completed'
         )
-        self.doc2 = GeneratedDocument.objects.create(
-            user=self.user2,
+        cls.doc2 = GeneratedDocument.objects.create(
+            user=cls.user2,
             document_type='cv',
             job_description_hash='def456',
             status='completed'
         )
+        cls.user1_auth_header = auth_header_for(cls.user1)
 
     def test_unauthorized_access(self):
         """Test that unauthenticated users can't access export endpoints"""
-        url = reverse('export_document', kwargs={'generation_id': self.doc1.id})
+        url = export_url(self.doc1.id)
         response = self.client.post(url, {'format': 'pdf'})
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
     def test_user_isolation(self):
         """Test that users can only export their own documents"""
         # Authenticate as user1
-        token = RefreshToken.for_user(self.user1).access_token
-        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        self.client.credentials(HTTP_AUTHORIZATION=self.user1_auth_header)
 
         # User1 should not be able to export user2's document
-        url = reverse('export_document', kwargs={'generation_id': self.doc2.id})
+        url = export_url(self.doc2.id)
         response = self.client.post(url, {'format': 'pdf'})
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
         # User1 should be able to export their own document
-        url = reverse('export_document', kwargs={'generation_id': self.doc1.id})
-        with patch('export.tasks.export_document_task.delay'):
-            response = self.client.post(url, {'format': 'pdf'})
+        url = export_url(self.doc1.id)
+        response = self.client.post(url, {'format': 'pdf'})
         self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
\ No newline at end of file
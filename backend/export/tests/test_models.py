@@ -3,10 +3,8 @@ Unit tests for export app models
 """
 
 import uuid
-from datetime import datetime, timedelta
 from django.test import TestCase
 from django.contrib.auth import get_user_model
-from django.utils import timezone
 
 from export.models import ExportJob, ExportTemplate, ExportAnalytics
 from generation.models import GeneratedDocument, JobDescription
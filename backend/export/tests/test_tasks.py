@@ -8,12 +8,11 @@ from django.test import TestCase
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 
-from export.models import ExportJob, ExportTemplate, ExportAnalytics
+from export.models import ExportJob, ExportAnalytics
 from export.tasks import (
-    export_document_task, generate_pdf_document, generate_docx_document,
-    cleanup_expired_exports, validate_evidence_links_for_export
+    export_document_task, cleanup_expired_exports, validate_evidence_links_for_export
 )
-from generation.models import GeneratedDocument, JobDescription
+from generation.models import GeneratedDocument
 
 User = get_user_model()
 
@@ -138,8 +137,7 @@ class ExportTaskTests(TestCase):
             deleted_count = cleanup_expired_exports()
 
         self.assertEqual(deleted_count, 1)
-        self.assertEqual(ExportJob.objects.count(), 1)
-        self.assertEqual(ExportJob.objects.first().id, valid_job.id)
+        self.assertEqual(list(ExportJob.objects.values_list('id', flat=True)), [valid_job.id])
 
     @patch('requests.head')
     def test_validate_evidence_links_for_export(self, mock_requests):
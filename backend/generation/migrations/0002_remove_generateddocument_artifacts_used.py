@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-17 06:50
+
+from django.db import migrations
+
+
+ARTIFACTS_USED_INDEX = "generated_doc_artifacts_used_gin"
+
+
+def create_artifacts_used_index(apps, schema_editor):
+    # JSONB GIN indexes are PostgreSQL-only; SQLite dev databases skip this.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    table = apps.get_model("generation", "GeneratedDocument")._meta.db_table
+    schema_editor.execute(
+        f"CREATE INDEX IF NOT EXISTS {ARTIFACTS_USED_INDEX} ON {table} "
+        f"USING gin ((metadata -> 'artifacts_used') jsonb_path_ops)"
+    )
+
+
+def drop_artifacts_used_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(f"DROP INDEX IF EXISTS {ARTIFACTS_USED_INDEX}")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("generation", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="generateddocument",
+            name="artifacts_used",
+        ),
+        migrations.RunPython(create_artifacts_used_index, drop_artifacts_used_index),
+    ]
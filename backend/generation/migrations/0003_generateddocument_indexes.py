@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:07
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('generation', '0002_remove_generateddocument_artifacts_used'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='generateddocument',
+            index=models.Index(fields=['user', '-created_at'], name='generation__user_id_994814_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='generateddocument',
+            index=models.Index(fields=['status'], name='generation__status_ade5c4_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='generateddocument',
+            index=models.Index(fields=['expires_at'], name='generation__expires_e97231_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:37
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('generation', '0003_generateddocument_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='generateddocument',
+            index=models.Index(fields=['user', 'template_id'], name='generation__user_id_f51737_idx'),
+        ),
+    ]
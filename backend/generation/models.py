@@ -19,10 +19,19 @@ class JobDescription(models.Model):
     parsing_confidence = models.FloatField(default=0.0)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    @staticmethod
+    def compute_content_hash(content):
+        """
+        SHA-256 hex digest used as the job description cache key.
+        Stored in content_hash and GeneratedDocument.job_description_hash, so the
+        algorithm must not change without rehashing existing rows.
+        """
+        return hashlib.sha256(content.encode()).hexdigest()
+
     @classmethod
     def get_or_create_from_content(cls, content, company_name="", role_title=""):
         """Get or create job description from content hash."""
-        content_hash = hashlib.sha256(content.encode()).hexdigest()
+        content_hash = cls.compute_content_hash(content)
         job_desc, created = cls.objects.get_or_create(
             content_hash=content_hash,
             defaults={
@@ -72,8 +81,7 @@ class GeneratedDocument(models.Model):
     progress_percentage = models.IntegerField(default=0)
     error_message = models.TextField(blank=True)
 
-    # Processing info
-    artifacts_used = models.JSONField(default=list, blank=True)
+    # Processing info (artifacts used are stored in metadata['artifacts_used'])
     model_version = models.CharField(max_length=50, blank=True)
     generation_time_ms = models.IntegerField(null=True, blank=True)
 
@@ -88,6 +96,17 @@ class GeneratedDocument(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', '-created_at']),  # per-user history listing
+            models.Index(fields=['user', 'template_id']),  # template usage in generation_analytics
+            models.Index(fields=['status']),
+            models.Index(fields=['expires_at']),  # cleanup_expired_generations
+        ]
+
+    @staticmethod
+    def analytics_cache_key(user_id):
+        """Cache key for a user's generation_analytics response."""
+        return f'generation:analytics:{user_id}'
 
     def __str__(self):
         return f"{self.get_document_type_display()} for {self.user.email} - {self.status}"
@@ -17,29 +17,29 @@ class CVGenerationRequestSerializer(serializers.Serializer):
     custom_sections = serializers.DictField(required=False, default=dict)
     generation_preferences = serializers.DictField(required=False, default=dict)
 
+    # Built once at import rather than on every validation call
+    ALLOWED_TONES = ['professional', 'technical', 'creative']
+    ALLOWED_LENGTHS = ['concise', 'detailed']
+    ALLOWED_SECTIONS = frozenset({
+        'include_publications',
+        'include_certifications',
+        'include_volunteer'
+    })
+
     def validate_generation_preferences(self, value):
         """Validate generation preferences structure."""
-        allowed_tones = ['professional', 'technical', 'creative']
-        allowed_lengths = ['concise', 'detailed']
-
-        if 'tone' in value and value['tone'] not in allowed_tones:
-            raise serializers.ValidationError(f"Tone must be one of: {allowed_tones}")
+        if 'tone' in value and value['tone'] not in self.ALLOWED_TONES:
+            raise serializers.ValidationError(f"Tone must be one of: {self.ALLOWED_TONES}")
 
-        if 'length' in value and value['length'] not in allowed_lengths:
-            raise serializers.ValidationError(f"Length must be one of: {allowed_lengths}")
+        if 'length' in value and value['length'] not in self.ALLOWED_LENGTHS:
+            raise serializers.ValidationError(f"Length must be one of: {self.ALLOWED_LENGTHS}")
 
         return value
 
     def validate_custom_sections(self, value):
         """Validate custom sections structure."""
-        allowed_sections = [
-            'include_publications',
-            'include_certifications',
-            'include_volunteer'
-        ]
-
         for key in value.keys():
-            if key not in allowed_sections:
+            if key not in self.ALLOWED_SECTIONS:
                 raise serializers.ValidationError(f"Unknown section: {key}")
 
         return value
@@ -59,6 +59,8 @@ class GeneratedDocumentSerializer(serializers.ModelSerializer):
 class GeneratedDocumentDetailSerializer(serializers.ModelSerializer):
     """Detailed serializer for generated documents with full content."""
 
+    artifacts_used = serializers.SerializerMethodField()
+
     class Meta:
         model = GeneratedDocument
         fields = ('id', 'document_type', 'job_description_hash', 'label_ids',
@@ -71,6 +73,9 @@ class GeneratedDocumentDetailSerializer(serializers.ModelSerializer):
                            'model_version', 'generation_time_ms', 'created_at',
                            'completed_at', 'expires_at')
 
+    def get_artifacts_used(self, obj):
+        return (obj.metadata or {}).get('artifacts_used', [])
+
 
 class JobDescriptionSerializer(serializers.ModelSerializer):
     """Serializer for job descriptions."""
@@ -9,13 +9,23 @@ from celery import shared_task
 from django.utils import timezone
 from django.apps import apps
 from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F
 from llm_services.services.enhanced_llm_service import EnhancedLLMService
-from llm_services.services.embedding_service import FlexibleEmbeddingService
+from llm_services.services.embedding_service import FlexibleEmbeddingService, compute_job_hash
 from llm_services.services.document_processor import AdvancedDocumentProcessor
 
 logger = logging.getLogger(__name__)
 
 
+def _fail_generation(generation, error_message):
+    """Mark a generation failed and drop the owner's cached analytics, like completion does."""
+    generation.status = 'failed'
+    generation.error_message = error_message
+    generation.save(update_fields=['status', 'error_message'])
+    cache.delete(generation.analytics_cache_key(generation.user_id))
+
+
 @shared_task
 def generate_cv_task(generation_id):
     """
@@ -27,11 +37,12 @@ def generate_cv_task(generation_id):
         GeneratedDocument = apps.get_model('generation', 'GeneratedDocument')
         JobDescription = apps.get_model('generation', 'JobDescription')
         Artifact = apps.get_model('artifacts', 'Artifact')
+        EvidenceLink = apps.get_model('artifacts', 'EvidenceLink')
 
         generation = GeneratedDocument.objects.get(id=generation_id)
         generation.status = 'processing'
         generation.progress_percentage = 10
-        generation.save()
+        generation.save(update_fields=['status', 'progress_percentage'])
 
         # Get or parse job description
         if generation.job_description:
@@ -39,9 +50,7 @@ def generate_cv_task(generation_id):
         else:
             # This shouldn't happen, but handle gracefully
             logger.warning(f"No job description found for generation {generation_id}")
-            generation.status = 'failed'
-            generation.error_message = 'No job description provided'
-            generation.save()
+            _fail_generation(generation, 'No job description provided')
             return
 
         # Parse job description using enhanced LLM service
@@ -56,17 +65,15 @@ def generate_cv_task(generation_id):
             ))
 
             if 'error' in parsing_result:
-                generation.status = 'failed'
-                generation.error_message = f"Failed to parse job description: {parsing_result['error']}"
-                generation.save()
+                _fail_generation(generation, f"Failed to parse job description: {parsing_result['error']}")
                 return
 
             job_desc.parsed_data = parsing_result
             job_desc.parsing_confidence = parsing_result.get('confidence_score', 0.5)
-            job_desc.save()
+            job_desc.save(update_fields=['parsed_data', 'parsing_confidence'])
 
         generation.progress_percentage = 30
-        generation.save()
+        generation.save(update_fields=['progress_percentage'])
 
         # Get user artifacts
         user_artifacts = Artifact.objects.filter(user=generation.user)
@@ -77,36 +84,36 @@ def generate_cv_task(generation_id):
             # For now, we'll use all artifacts
             pass
 
-        # Convert artifacts to dict format for LLM
-        artifacts_data = []
-        for artifact in user_artifacts:
-            artifact_dict = {
-                'id': artifact.id,
-                'title': artifact.title,
-                'description': artifact.description,
-                'artifact_type': artifact.artifact_type,
-                'start_date': str(artifact.start_date) if artifact.start_date else None,
-                'end_date': str(artifact.end_date) if artifact.end_date else None,
-                'technologies': artifact.technologies,
-                'collaborators': artifact.collaborators,
-                'evidence_links': [
-                    {
-                        'url': link.url,
-                        'type': link.link_type,
-                        'description': link.description
-                    }
-                    for link in artifact.evidence_links.all()
-                ],
-                'extracted_metadata': artifact.extracted_metadata
-            }
-            artifacts_data.append(artifact_dict)
+        # Convert artifacts to dict format for LLM straight from values() rows,
+        # with evidence links fetched in one query instead of one per artifact
+        evidence_links_by_artifact = {}
+        for link in EvidenceLink.objects.filter(artifact__in=user_artifacts).values(
+            'artifact_id', 'url', 'link_type', 'description'
+        ):
+            evidence_links_by_artifact.setdefault(link['artifact_id'], []).append({
+                'url': link['url'],
+                'type': link['link_type'],
+                'description': link['description']
+            })
+
+        artifacts_data = list(user_artifacts.values(
+            'id', 'title', 'description', 'artifact_type', 'start_date', 'end_date',
+            'technologies', 'collaborators', 'extracted_metadata'
+        ))
+        for artifact_dict in artifacts_data:
+            artifact_dict['start_date'] = str(artifact_dict['start_date']) if artifact_dict['start_date'] else None
+            artifact_dict['end_date'] = str(artifact_dict['end_date']) if artifact_dict['end_date'] else None
+            artifact_dict['evidence_links'] = evidence_links_by_artifact.get(artifact_dict['id'], [])
 
         generation.progress_percentage = 50
-        generation.save()
+        generation.save(update_fields=['progress_percentage'])
 
         # Enhanced artifact ranking with semantic similarity
-        job_requirements = job_desc.parsed_data.get('must_have_skills', []) + \
-                          job_desc.parsed_data.get('nice_to_have_skills', [])
+        must_have_skills = job_desc.parsed_data.get('must_have_skills', [])
+        job_requirements = must_have_skills + job_desc.parsed_data.get('nice_to_have_skills', [])
+        # Normalize once; shared by the skill match and missing skill helpers below
+        job_requirements_lower = [req.lower() for req in job_requirements]
+        must_have_skills_lower = job_requirements_lower[:len(must_have_skills)]
 
         ranked_artifacts = asyncio.run(llm_service.rank_artifacts_by_relevance(
             artifacts_data,
@@ -115,7 +122,7 @@ def generate_cv_task(generation_id):
         ))
 
         generation.progress_percentage = 70
-        generation.save()
+        generation.save(update_fields=['progress_percentage'])
 
         # Generate CV content with enhanced service
         logger.info(f"Generating CV content for generation {generation_id} with enhanced service")
@@ -127,14 +134,14 @@ def generate_cv_task(generation_id):
         ))
 
         if 'error' in cv_result:
-            generation.status = 'failed'
-            generation.error_message = f"Failed to generate CV: {cv_result['error']}"
-            generation.save()
+            _fail_generation(generation, f"Failed to generate CV: {cv_result['error']}")
             return
 
         # Store the generated content with enhanced metadata
         generation.content = cv_result.get('content', {})
         processing_metadata = cv_result.get('processing_metadata', {})
+        key_skills = generation.content.get('key_skills', [])
+        key_skills_lower = [skill.lower() for skill in key_skills]
 
         generation.metadata = {
             'model_used': processing_metadata.get('model_used'),
@@ -147,16 +154,19 @@ def generate_cv_task(generation_id):
             'fallback_used': processing_metadata.get('fallback_used', False),
             'artifacts_used': [a['id'] for a in ranked_artifacts[:5]],  # Top 5 used
             'skill_match_score': calculate_skill_match_score(
-                generation.content.get('key_skills', []),
-                job_requirements
+                key_skills,
+                job_requirements,
+                user_skills_lower=key_skills_lower,
+                job_requirements_lower=job_requirements_lower
             ),
             'missing_skills': find_missing_skills(
-                generation.content.get('key_skills', []),
-                job_desc.parsed_data.get('must_have_skills', [])
+                key_skills,
+                must_have_skills,
+                user_skills_lower=key_skills_lower,
+                required_skills_lower=must_have_skills_lower
             )
         }
 
-        generation.artifacts_used = generation.metadata['artifacts_used']
         generation.model_version = processing_metadata.get('model_used', 'unknown')
         generation.generation_time_ms = processing_metadata.get('processing_time_ms')
         generation.model_selection_strategy = getattr(settings, 'MODEL_SELECTION_STRATEGY', 'balanced')
@@ -166,7 +176,11 @@ def generate_cv_task(generation_id):
         generation.status = 'completed'
         generation.progress_percentage = 100
         generation.completed_at = timezone.now()
-        generation.save()
+        generation.save(update_fields=[
+            'content', 'metadata', 'model_version', 'generation_time_ms',
+            'status', 'progress_percentage', 'completed_at'
+        ])
+        cache.delete(GeneratedDocument.analytics_cache_key(generation.user_id))
 
         logger.info(f"Successfully generated CV for generation {generation_id}")
 
@@ -174,61 +188,79 @@ def generate_cv_task(generation_id):
         logger.error(f"Error generating CV for {generation_id}: {e}")
         try:
             generation = GeneratedDocument.objects.get(id=generation_id)
-            generation.status = 'failed'
-            generation.error_message = str(e)
-            generation.save()
+            _fail_generation(generation, str(e))
         except:
             pass
 
 
-def calculate_skill_match_score(user_skills, job_requirements):
+def _match_required_skills(user_skills_lower, required_skills_lower):
+    """
+    Flag each required skill that matches a user skill. A match is a substring
+    in either direction, so 'javascript' matches 'javascript programming'.
+    """
+    user_skill_set = frozenset(user_skills_lower)
+    # One C-level scan over the joined skills covers "requirement inside a user skill";
+    # the NUL separator keeps matches from spanning two skills
+    joined_user_skills = '\0'.join(user_skills_lower)
+
+    return [
+        req in user_skill_set
+        or req in joined_user_skills
+        or any(user_skill in req for user_skill in user_skills_lower)
+        for req in required_skills_lower
+    ]
+
+
+def calculate_skill_match_score(user_skills, job_requirements,
+                                user_skills_lower=None, job_requirements_lower=None):
     """Calculate how well user skills match job requirements (0-10)."""
     if not user_skills or not job_requirements:
         return 0
 
-    # Normalize skills to lowercase for comparison
-    user_skills_lower = [skill.lower() for skill in user_skills]
-    job_requirements_lower = [req.lower() for req in job_requirements]
+    # Normalize skills to lowercase for comparison, unless the caller already did
+    if user_skills_lower is None:
+        user_skills_lower = [skill.lower() for skill in user_skills]
+    if job_requirements_lower is None:
+        job_requirements_lower = [req.lower() for req in job_requirements]
 
-    matches = 0
-    for req in job_requirements_lower:
-        for user_skill in user_skills_lower:
-            if req in user_skill or user_skill in req:
-                matches += 1
-                break
+    matches = sum(_match_required_skills(user_skills_lower, job_requirements_lower))
 
     # Calculate score (0-10)
     match_ratio = matches / len(job_requirements_lower)
     return min(10, int(match_ratio * 10))
 
 
-def find_missing_skills(user_skills, required_skills):
+def find_missing_skills(user_skills, required_skills,
+                        user_skills_lower=None, required_skills_lower=None):
     """Find required skills that are missing from user skills."""
     if not user_skills or not required_skills:
         return required_skills
 
-    user_skills_lower = [skill.lower() for skill in user_skills]
-    missing = []
-
-    for req_skill in required_skills:
-        req_skill_lower = req_skill.lower()
-        found = False
+    if user_skills_lower is None:
+        user_skills_lower = [skill.lower() for skill in user_skills]
+    if required_skills_lower is None:
+        required_skills_lower = [skill.lower() for skill in required_skills]
 
-        for user_skill in user_skills_lower:
-            if req_skill_lower in user_skill or user_skill in req_skill_lower:
-                found = True
-                break
-
-        if not found:
-            missing.append(req_skill)
-
-    return missing
+    matched = _match_required_skills(user_skills_lower, required_skills_lower)
+    return [req_skill for req_skill, found in zip(required_skills, matched) if not found]
 
 
 @shared_task
 def generate_job_embedding_cache(job_description: str, company_name: str = "", role_title: str = "", user_id: int = None):
     """Pre-generate and cache job description embedding for faster CV generation."""
     try:
+        # Short-circuit on cache hit before spinning up the embedding service and event loop.
+        # A single UPDATE both detects the hit and records the access.
+        JobDescriptionEmbedding = apps.get_model('llm_services', 'JobDescriptionEmbedding')
+        job_hash = compute_job_hash(job_description, company_name, role_title)
+        cache_hit = JobDescriptionEmbedding.objects.filter(job_description_hash=job_hash).update(
+            access_count=F('access_count') + 1,
+            last_accessed=timezone.now()
+        )
+        if cache_hit:
+            logger.info(f"Job embedding already cached: {job_hash[:8]}...")
+            return {'job_hash': job_hash, 'cached': True}
+
         embedding_service = FlexibleEmbeddingService()
 
         result = asyncio.run(embedding_service.generate_and_cache_job_embedding(
@@ -388,12 +420,16 @@ def cleanup_expired_generations():
     """Cleanup expired generated documents."""
     GeneratedDocument = apps.get_model('generation', 'GeneratedDocument')
 
-    expired_count = GeneratedDocument.objects.filter(
+    # Feedback and export jobs cascade in Django rather than in the database, so a
+    # raw DELETE isn't safe; only load the primary keys the collector needs instead
+    # of the JSON content columns.
+    _, deleted_per_model = GeneratedDocument.objects.filter(
         expires_at__lt=timezone.now()
-    ).delete()
+    ).only('id').delete()
+    expired_count = deleted_per_model.get(GeneratedDocument._meta.label, 0)
 
-    logger.info(f"Cleaned up {expired_count[0]} expired generated documents")
-    return expired_count[0]
+    logger.info(f"Cleaned up {expired_count} expired generated documents")
+    return expired_count
 
 
 @shared_task
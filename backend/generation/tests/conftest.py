@@ -5,7 +5,7 @@ Pytest configuration and fixtures for generation app tests
 import pytest
 from django.contrib.auth import get_user_model
 from rest_framework.test import APIClient
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.tokens import AccessToken
 
 from generation.models import JobDescription, GeneratedDocument, CVTemplate
 
@@ -30,43 +30,72 @@ def api_client():
     return APIClient()
 
 
+@pytest.fixture(scope='session')
+def access_tokens():
+    """Signed access tokens keyed by user id, shared by the whole test session"""
+    return {}
+
+
+@pytest.fixture
+def access_token(user, access_tokens):
+    """Access token for the test user, signed once per user id"""
+    if user.pk not in access_tokens:
+        # AccessToken.for_user skips the refresh token and its OutstandingToken insert
+        access_tokens[user.pk] = str(AccessToken.for_user(user))
+    return access_tokens[user.pk]
+
+
 @pytest.fixture
-def authenticated_client(user, api_client):
+def authenticated_client(access_token, api_client):
     """Create an authenticated API client"""
-    token = RefreshToken.for_user(user).access_token
-    api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+    api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
     return api_client
 
 
-@pytest.fixture
-def job_description():
-    """Create a test job description"""
-    return JobDescription.objects.create(
-        content_hash='test123',
-        raw_content='Looking for Python developer with Django experience',
-        company_name='TechCorp',
-        role_title='Python Developer',
-        parsing_confidence=0.9,
-        parsed_data={
-            'must_have_skills': ['Python', 'Django'],
-            'nice_to_have_skills': ['React'],
-            'experience_level': 'mid'
-        }
-    )
+@pytest.fixture(scope='session')
+def job_description(django_db_setup, django_db_blocker):
+    """
+    Shared, read-only job description created once per session.
+    Tests that modify it must work on their own copy instead.
+    """
+    with django_db_blocker.unblock():
+        job_desc = JobDescription.objects.create(
+            content_hash='test123',
+            raw_content='Looking for Python developer with Django experience',
+            company_name='TechCorp',
+            role_title='Python Developer',
+            parsing_confidence=0.9,
+            parsed_data={
+                'must_have_skills': ['Python', 'Django'],
+                'nice_to_have_skills': ['React'],
+                'experience_level': 'mid'
+            }
+        )
+    yield job_desc
+    # Created outside the per-test transaction, so it has to be removed explicitly
+    with django_db_blocker.unblock():
+        job_desc.delete()
 
 
-@pytest.fixture
-def cv_template():
-    """Create a test CV template"""
-    return CVTemplate.objects.create(
-        name='Test Template',
-        category='modern',
-        description='A test template for testing',
-        template_config={'font': 'Arial', 'color': '#000'},
-        prompt_template='Generate CV with: {requirements}',
-        is_active=True,
-        is_premium=False
-    )
+@pytest.fixture(scope='session')
+def cv_template(django_db_setup, django_db_blocker):
+    """
+    Shared, read-only CV template created once per session.
+    Tests that modify it must work on their own copy instead.
+    """
+    with django_db_blocker.unblock():
+        template = CVTemplate.objects.create(
+            name='Test Template',
+            category='modern',
+            description='A test template for testing',
+            template_config={'font': 'Arial', 'color': '#000'},
+            prompt_template='Generate CV with: {requirements}',
+            is_active=True,
+            is_premium=False
+        )
+    yield template
+    with django_db_blocker.unblock():
+        template.delete()
 
 
 @pytest.fixture
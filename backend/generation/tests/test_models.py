@@ -3,7 +3,8 @@ Unit tests for generation app models
 """
 
 import uuid
-from datetime import datetime, timedelta
+import hashlib
+from datetime import timedelta
 from django.test import TestCase
 from django.contrib.auth import get_user_model
 from django.utils import timezone
@@ -51,6 +52,17 @@ class JobDescriptionModelTests(TestCase):
         self.assertFalse(created2)
         self.assertEqual(job_desc1.id, job_desc2.id)
 
+    def test_compute_content_hash_is_stable(self):
+        """Test content hash keeps the stored SHA-256 hex format"""
+        content = 'Looking for a Python developer'
+        content_hash = JobDescription.compute_content_hash(content)
+
+        self.assertEqual(content_hash, hashlib.sha256(content.encode()).hexdigest())
+        self.assertEqual(len(content_hash), 64)
+
+        job_desc, _ = JobDescription.get_or_create_from_content(content)
+        self.assertEqual(job_desc.content_hash, content_hash)
+
     def test_job_description_string_representation(self):
         """Test __str__ method"""
         job_desc = JobDescription.objects.create(
@@ -73,13 +85,14 @@ class JobDescriptionModelTests(TestCase):
 class GeneratedDocumentModelTests(TestCase):
     """Test cases for GeneratedDocument model"""
 
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             email='test@example.com',
             username='testuser',
             password='testpass123'
         )
-        self.job_desc = JobDescription.objects.create(
+        cls.job_desc = JobDescription.objects.create(
             content_hash='abc123',
             raw_content='Test job description'
         )
@@ -178,14 +191,15 @@ class CVTemplateModelTests(TestCase):
 class GenerationFeedbackModelTests(TestCase):
     """Test cases for GenerationFeedback model"""
 
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             email='test@example.com',
             username='testuser',
             password='testpass123'
         )
-        self.generation = GeneratedDocument.objects.create(
-            user=self.user,
+        cls.generation = GeneratedDocument.objects.create(
+            user=cls.user,
             document_type='cv',
             job_description_hash='abc123'
         )
@@ -3,13 +3,13 @@ Unit tests for generation app Celery tasks
 """
 
 from unittest.mock import patch, Mock, AsyncMock
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 from datetime import timedelta
 
 from generation.models import (
-    JobDescription, GeneratedDocument, CVTemplate
+    JobDescription, GeneratedDocument, GenerationFeedback
 )
 from generation.tasks import (
     generate_cv_task, calculate_skill_match_score,
@@ -20,16 +20,89 @@ from artifacts.models import Artifact
 User = get_user_model()
 
 
+class SkillMatchingTests(SimpleTestCase):
+    """Test cases for the pure skill matching helpers (no database access)"""
+
+    def test_calculate_skill_match_score(self):
+        """Test skill matching score calculation"""
+        cases = [
+            # 2 of 3 requirements matched
+            (['Python', 'Django', 'JavaScript'], ['Python', 'Django', 'React'], int((2/3) * 10)),
+            ([], ['Python'], 0),
+            (['Python'], [], 0),
+        ]
+        for user_skills, job_requirements, expected_score in cases:
+            with self.subTest(user_skills=user_skills, job_requirements=job_requirements):
+                self.assertEqual(calculate_skill_match_score(user_skills, job_requirements), expected_score)
+
+    def test_find_missing_skills(self):
+        """Test finding missing skills, including partial (substring) matches"""
+        cases = [
+            (['Python', 'Django'], ['Python', 'Django', 'React', 'TypeScript'], ['React', 'TypeScript']),
+            # JavaScript and Python are matched inside the longer user skills
+            (['JavaScript Programming', 'Python Development'], ['JavaScript', 'Python', 'React'], ['React']),
+        ]
+        for user_skills, required_skills, expected_missing in cases:
+            with self.subTest(user_skills=user_skills, required_skills=required_skills):
+                self.assertEqual(find_missing_skills(user_skills, required_skills), expected_missing)
+
+    def test_skill_matching_matches_pairwise_substring_rule(self):
+        """Test set-based matching agrees with the pairwise substring definition"""
+        cases = [
+            (['Python', 'Django'], ['python', 'DJANGO', 'React']),
+            (['JavaScript Programming'], ['JavaScript', 'Java', 'Script', 'TypeScript']),
+            (['Go'], ['Golang', 'Django', 'Rust']),
+            (['ab', 'cd'], ['bc', 'abcd', 'ab']),  # no match across two user skills
+            (['C++', 'SQL'], ['c++', 'PostgreSQL', 'NoSQL databases', 'C#']),
+        ]
+        for user_skills, required_skills in cases:
+            with self.subTest(user_skills=user_skills, required_skills=required_skills):
+                user_lower = [s.lower() for s in user_skills]
+                expected_missing = [
+                    req for req in required_skills
+                    if not any(req.lower() in u or u in req.lower() for u in user_lower)
+                ]
+                expected_score = min(10, int(
+                    (len(required_skills) - len(expected_missing)) / len(required_skills) * 10
+                ))
+
+                self.assertEqual(find_missing_skills(user_skills, required_skills), expected_missing)
+                self.assertEqual(calculate_skill_match_score(user_skills, required_skills), expected_score)
+
+    def test_skill_helpers_with_prenormalized_lists(self):
+        """Test helpers accept lowercased lists computed once by the caller"""
+        user_skills = ['Python', 'Django']
+        required_skills = ['Python', 'React']
+        user_skills_lower = ['python', 'django']
+        required_skills_lower = ['python', 'react']
+
+        score = calculate_skill_match_score(
+            user_skills, required_skills,
+            user_skills_lower=user_skills_lower,
+            job_requirements_lower=required_skills_lower
+        )
+        missing = find_missing_skills(
+            user_skills, required_skills,
+            user_skills_lower=user_skills_lower,
+            required_skills_lower=required_skills_lower
+        )
+
+        self.assertEqual(score, calculate_skill_match_score(user_skills, required_skills))
+        # Original casing is preserved in the result
+        self.assertEqual(missing, ['React'])
+
+
 class GenerationTaskTests(TestCase):
     """Test cases for generation Celery tasks"""
 
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             email='test@example.com',
             username='testuser',
             password='testpass123'
         )
-        self.job_desc = JobDescription.objects.create(
+        cls.job_desc = JobDescription.objects.create(
             content_hash='abc123',
             raw_content='Python developer position',
             parsed_data={
@@ -37,50 +110,12 @@ class GenerationTaskTests(TestCase):
                 'nice_to_have_skills': ['React']
             }
         )
-        self.artifact = Artifact.objects.create(
-            user=self.user,
+        cls.artifact = Artifact.objects.create(
+            user=cls.user,
             title='Django Project',
             technologies=['Python', 'Django']
         )
 
-    def test_calculate_skill_match_score(self):
-        """Test skill matching score calculation"""
-        user_skills = ['Python', 'Django', 'JavaScript']
-        job_requirements = ['Python', 'Django', 'React']
-
-        score = calculate_skill_match_score(user_skills, job_requirements)
-
-        # Should match 2 out of 3 requirements
-        expected_score = int((2/3) * 10)
-        self.assertEqual(score, expected_score)
-
-    def test_calculate_skill_match_score_empty(self):
-        """Test skill matching with empty inputs"""
-        self.assertEqual(calculate_skill_match_score([], ['Python']), 0)
-        self.assertEqual(calculate_skill_match_score(['Python'], []), 0)
-
-    def test_find_missing_skills(self):
-        """Test finding missing skills"""
-        user_skills = ['Python', 'Django']
-        required_skills = ['Python', 'Django', 'React', 'TypeScript']
-
-        missing = find_missing_skills(user_skills, required_skills)
-
-        self.assertEqual(len(missing), 2)
-        self.assertIn('React', missing)
-        self.assertIn('TypeScript', missing)
-
-    def test_find_missing_skills_partial_match(self):
-        """Test partial skill matching"""
-        user_skills = ['JavaScript Programming', 'Python Development']
-        required_skills = ['JavaScript', 'Python', 'React']
-
-        missing = find_missing_skills(user_skills, required_skills)
-
-        # JavaScript and Python should be matched, only React missing
-        self.assertEqual(len(missing), 1)
-        self.assertIn('React', missing)
-
     @patch('generation.tasks.EnhancedLLMService')
     def test_generate_cv_task_no_llm(self, mock_llm_service):
         """Test CV generation task without LLM service"""
@@ -109,12 +144,14 @@ class GenerationTaskTests(TestCase):
         """Test cleanup of expired generations"""
         # Create expired generation
         expired_time = timezone.now() - timedelta(days=1)
-        GeneratedDocument.objects.create(
+        expired = GeneratedDocument.objects.create(
             user=self.user,
             document_type='cv',
             job_description_hash='abc123',
             expires_at=expired_time
         )
+        # Feedback must be cascaded along with the expired document
+        GenerationFeedback.objects.create(generation=expired, feedback_type='rating')
 
         # Create valid generation
         future_time = timezone.now() + timedelta(days=1)
@@ -129,4 +166,5 @@ class GenerationTaskTests(TestCase):
         deleted_count = cleanup_expired_generations()
 
         self.assertEqual(deleted_count, 1)
-        self.assertEqual(GeneratedDocument.objects.count(), 1)
\ No newline at end of file
+        self.assertEqual(GeneratedDocument.objects.count(), 1)
+        self.assertFalse(GenerationFeedback.objects.exists())
\ No newline at end of file
@@ -3,6 +3,10 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
 # from django_ratelimit.decorators import ratelimit
 from django.utils.decorators import method_decorator
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Avg, Count, Q
+from django.utils.cache import patch_cache_control
 from django.utils import timezone
 from datetime import timedelta
 from .models import GeneratedDocument, JobDescription, CVTemplate, GenerationFeedback
@@ -13,6 +17,9 @@ from .serializers import (
 )
 from .tasks import generate_cv_task
 
+# Analytics are recomputed at most once a minute per user unless a change invalidates them
+ANALYTICS_CACHE_TIMEOUT = 60
+
 
 @api_view(['POST'])
 @permission_classes([permissions.IsAuthenticated])
@@ -30,31 +37,34 @@ def generate_cv(request):
     try:
         data = serializer.validated_data
 
-        # Get or create job description
-        job_desc, created = JobDescription.get_or_create_from_content(
-            data['job_description'],
-            data.get('company_name', ''),
-            data.get('role_title', '')
-        )
-
-        # Set expiration (90 days from now)
-        expires_at = timezone.now() + timedelta(days=90)
-
-        # Create generation document
-        generation = GeneratedDocument.objects.create(
-            user=request.user,
-            document_type='cv',
-            job_description_hash=job_desc.content_hash,
-            job_description=job_desc,
-            label_ids=data.get('label_ids', []),
-            template_id=data.get('template_id', 1),
-            custom_sections=data.get('custom_sections', {}),
-            generation_preferences=data.get('generation_preferences', {}),
-            expires_at=expires_at
-        )
-
-        # Start async generation
-        generate_cv_task.delay(str(generation.id))
+        with transaction.atomic():
+            # Get or create job description
+            job_desc, created = JobDescription.get_or_create_from_content(
+                data['job_description'],
+                data.get('company_name', ''),
+                data.get('role_title', '')
+            )
+
+            # Set expiration (90 days from now)
+            expires_at = timezone.now() + timedelta(days=90)
+
+            # Create generation document
+            generation = GeneratedDocument.objects.create(
+                user=request.user,
+                document_type='cv',
+                job_description_hash=job_desc.content_hash,
+                job_description=job_desc,
+                label_ids=data.get('label_ids', []),
+                template_id=data.get('template_id', 1),
+                custom_sections=data.get('custom_sections', {}),
+                generation_preferences=data.get('generation_preferences', {}),
+                expires_at=expires_at
+            )
+
+            # Start async generation once the rows are committed, so the worker always finds them
+            transaction.on_commit(lambda gid=str(generation.id): generate_cv_task.delay(gid))
+
+        cache.delete(GeneratedDocument.analytics_cache_key(request.user.id))
 
         return Response({
             'generation_id': str(generation.id),
@@ -86,31 +96,34 @@ def generate_cover_letter(request):
     try:
         data = serializer.validated_data
 
-        # Get or create job description
-        job_desc, created = JobDescription.get_or_create_from_content(
-            data['job_description'],
-            data.get('company_name', ''),
-            data.get('role_title', '')
-        )
-
-        # Set expiration (90 days from now)
-        expires_at = timezone.now() + timedelta(days=90)
-
-        # Create generation document for cover letter
-        generation = GeneratedDocument.objects.create(
-            user=request.user,
-            document_type='cover_letter',
-            job_description_hash=job_desc.content_hash,
-            job_description=job_desc,
-            label_ids=data.get('label_ids', []),
-            template_id=data.get('template_id', 1),
-            custom_sections=data.get('custom_sections', {}),
-            generation_preferences=data.get('generation_preferences', {}),
-            expires_at=expires_at
-        )
-
-        # Start async generation (same task handles both types)
-        generate_cv_task.delay(str(generation.id))
+        with transaction.atomic():
+            # Get or create job description
+            job_desc, created = JobDescription.get_or_create_from_content(
+                data['job_description'],
+                data.get('company_name', ''),
+                data.get('role_title', '')
+            )
+
+            # Set expiration (90 days from now)
+            expires_at = timezone.now() + timedelta(days=90)
+
+            # Create generation document for cover letter
+            generation = GeneratedDocument.objects.create(
+                user=request.user,
+                document_type='cover_letter',
+                job_description_hash=job_desc.content_hash,
+                job_description=job_desc,
+                label_ids=data.get('label_ids', []),
+                template_id=data.get('template_id', 1),
+                custom_sections=data.get('custom_sections', {}),
+                generation_preferences=data.get('generation_preferences', {}),
+                expires_at=expires_at
+            )
+
+            # Start async generation (same task handles both types) once the rows are committed
+            transaction.on_commit(lambda gid=str(generation.id): generate_cv_task.delay(gid))
+
+        cache.delete(GeneratedDocument.analytics_cache_key(request.user.id))
 
         return Response({
             'generation_id': str(generation.id),
@@ -158,9 +171,11 @@ class UserGenerationsListView(generics.ListAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
+        # Fetch only the serialized columns as dicts; the serializer reads mappings
+        # directly, so no model instances are built for the page
         return GeneratedDocument.objects.filter(
             user=self.request.user
-        ).order_by('-created_at')
+        ).values(*self.serializer_class.Meta.fields).order_by('-created_at')
 
 
 class GenerationDetailView(generics.RetrieveDestroyAPIView):
@@ -172,6 +187,10 @@ class GenerationDetailView(generics.RetrieveDestroyAPIView):
     def get_queryset(self):
         return GeneratedDocument.objects.filter(user=self.request.user)
 
+    def perform_destroy(self, instance):
+        super().perform_destroy(instance)
+        cache.delete(GeneratedDocument.analytics_cache_key(self.request.user.id))
+
 
 @api_view(['POST'])
 @permission_classes([permissions.IsAuthenticated])
@@ -180,7 +199,10 @@ def rate_generation(request, generation_id):
     Rate a generated document and provide feedback.
     """
     try:
-        generation = GeneratedDocument.objects.get(
+        # Only the rated columns are written back; skip loading the content JSON
+        generation = GeneratedDocument.objects.only(
+            'id', 'user_rating', 'user_feedback'
+        ).get(
             id=generation_id,
             user=request.user
         )
@@ -189,20 +211,21 @@ def rate_generation(request, generation_id):
         if not serializer.is_valid():
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-        # Update generation rating
-        generation.user_rating = serializer.validated_data['rating']
-        generation.user_feedback = serializer.validated_data.get('feedback', '')
-        generation.save()
-
-        # Create feedback record
-        GenerationFeedback.objects.create(
-            generation=generation,
-            feedback_type='rating',
-            feedback_data={
-                'rating': serializer.validated_data['rating'],
-                'feedback': serializer.validated_data.get('feedback', '')
-            }
-        )
+        # Update generation rating and record the feedback together
+        with transaction.atomic():
+            generation.user_rating = serializer.validated_data['rating']
+            generation.user_feedback = serializer.validated_data.get('feedback', '')
+            generation.save(update_fields=['user_rating', 'user_feedback'])
+
+            GenerationFeedback.objects.create(
+                generation=generation,
+                feedback_type='rating',
+                feedback_data={
+                    'rating': serializer.validated_data['rating'],
+                    'feedback': serializer.validated_data.get('feedback', '')
+                }
+            )
+        cache.delete(GeneratedDocument.analytics_cache_key(request.user.id))
 
         return Response({
             'message': 'Rating submitted successfully',
@@ -231,47 +254,66 @@ def generation_analytics(request):
     """
     Get analytics for user's generations.
     """
-    user_generations = GeneratedDocument.objects.filter(user=request.user)
+    cache_key = GeneratedDocument.analytics_cache_key(request.user.id)
+    analytics = cache.get(cache_key)
+    if analytics is None:
+        analytics = _compute_generation_analytics(request.user)
+        cache.set(cache_key, analytics, ANALYTICS_CACHE_TIMEOUT)
+
+    response = Response(analytics)
+    patch_cache_control(response, private=True, max_age=30)
+    return response
+
+
+def _compute_generation_analytics(user):
+    """Aggregate a user's generation statistics."""
+    user_generations = GeneratedDocument.objects.filter(user=user)
+
+    # Status counts and average rating in a single aggregate query
+    stats = user_generations.aggregate(
+        total=Count('id'),
+        completed=Count('id', filter=Q(status='completed')),
+        failed=Count('id', filter=Q(status='failed')),
+        average_rating=Avg('user_rating')
+    )
 
     analytics = {
-        'total_generations': user_generations.count(),
-        'completed_generations': user_generations.filter(status='completed').count(),
-        'failed_generations': user_generations.filter(status='failed').count(),
+        'total_generations': stats['total'],
+        'completed_generations': stats['completed'],
+        'failed_generations': stats['failed'],
         'average_rating': 0,
         'most_used_template': None,
         'generation_history': []
     }
 
-    # Calculate average rating
-    rated_generations = user_generations.filter(user_rating__isnull=False)
-    if rated_generations.exists():
-        total_rating = sum(g.user_rating for g in rated_generations)
-        analytics['average_rating'] = round(total_rating / rated_generations.count(), 1)
-
-    # Most used template
-    template_usage = {}
-    for gen in user_generations:
-        template_id = gen.template_id
-        template_usage[template_id] = template_usage.get(template_id, 0) + 1
-
-    if template_usage:
-        most_used_template_id = max(template_usage, key=template_usage.get)
-        try:
-            template = CVTemplate.objects.get(id=most_used_template_id)
-            analytics['most_used_template'] = template.name
-        except CVTemplate.DoesNotExist:
-            pass
+    # Avg ignores unrated generations
+    if stats['average_rating'] is not None:
+        analytics['average_rating'] = round(stats['average_rating'], 1)
+
+    # Most used template, counted in the database rather than over every row
+    top_template = (
+        user_generations.values('template_id')
+        .annotate(uses=Count('id'))
+        .order_by('-uses', 'template_id')
+        .first()
+    )
+    if top_template:
+        analytics['most_used_template'] = CVTemplate.objects.filter(
+            id=top_template['template_id']
+        ).values_list('name', flat=True).first()
 
     # Recent generation history (last 10)
-    recent_generations = user_generations.order_by('-created_at')[:10]
+    recent_generations = user_generations.order_by('-created_at').values(
+        'id', 'status', 'created_at', 'user_rating'
+    )[:10]
     analytics['generation_history'] = [
         {
-            'id': str(gen.id),
-            'status': gen.status,
-            'created_at': gen.created_at,
-            'rating': gen.user_rating
+            'id': str(gen['id']),
+            'status': gen['status'],
+            'created_at': gen['created_at'],
+            'rating': gen['user_rating']
         }
         for gen in recent_generations
     ]
 
-    return Response(analytics)
\ No newline at end of file
+    return analytics
\ No newline at end of file
@@ -22,6 +22,9 @@ class ModelPerformanceMetricAdmin(admin.ModelAdmin):
         'model_name', 'task_type', 'processing_time_ms', 'cost_usd',
         'quality_score', 'success', 'created_at'
     ]
+    list_select_related = ['user']
+    # Skip the unfiltered COUNT(*) shown next to filtered result counts
+    show_full_result_count = False
     list_filter = [
         'model_name', 'task_type', 'success', 'selection_strategy',
         'fallback_used', 'created_at'
@@ -46,9 +49,6 @@ class ModelPerformanceMetricAdmin(admin.ModelAdmin):
         })
     )
 
-    def get_queryset(self, request):
-        return super().get_queryset(request).select_related('user')
-
 
 @admin.register(EnhancedArtifact)
 class EnhancedArtifactAdmin(admin.ModelAdmin):
@@ -56,6 +56,8 @@ class EnhancedArtifactAdmin(admin.ModelAdmin):
         'title', 'content_type', 'user', 'total_chunks',
         'embedding_model', 'created_at'
     ]
+    list_select_related = ['user']
+    show_full_result_count = False
     list_filter = [
         'content_type', 'embedding_model', 'processing_strategy',
         'created_at', 'last_embedding_update'
@@ -84,9 +86,6 @@ class EnhancedArtifactAdmin(admin.ModelAdmin):
         })
     )
 
-    def get_queryset(self, request):
-        return super().get_queryset(request).select_related('user')
-
 
 class ArtifactChunkInline(admin.TabularInline):
     model = ArtifactChunk
@@ -101,6 +100,8 @@ class ArtifactChunkAdmin(admin.ModelAdmin):
         'artifact_title', 'chunk_index', 'model_used',
         'tokens_used', 'processing_cost_usd', 'created_at'
     ]
+    list_select_related = ['artifact']
+    show_full_result_count = False
     list_filter = ['model_used', 'created_at']
     search_fields = ['artifact__title', 'content']
     readonly_fields = ['id', 'content_hash', 'created_at']
@@ -110,9 +111,6 @@ class ArtifactChunkAdmin(admin.ModelAdmin):
         return obj.artifact.title
     artifact_title.short_description = 'Artifact Title'
 
-    def get_queryset(self, request):
-        return super().get_queryset(request).select_related('artifact')
-
 
 @admin.register(JobDescriptionEmbedding)
 class JobDescriptionEmbeddingAdmin(admin.ModelAdmin):
@@ -120,6 +118,8 @@ class JobDescriptionEmbeddingAdmin(admin.ModelAdmin):
         'role_title', 'company_name', 'user', 'model_used',
         'access_count', 'cost_usd', 'created_at'
     ]
+    list_select_related = ['user']
+    show_full_result_count = False
     list_filter = ['model_used', 'dimensions', 'created_at', 'last_accessed']
     search_fields = ['role_title', 'company_name', 'user__email']
     readonly_fields = ['id', 'job_description_hash', 'created_at', 'last_accessed']
@@ -137,9 +137,6 @@ class JobDescriptionEmbeddingAdmin(admin.ModelAdmin):
         })
     )
 
-    def get_queryset(self, request):
-        return super().get_queryset(request).select_related('user')
-
 
 @admin.register(ModelCostTracking)
 class ModelCostTrackingAdmin(admin.ModelAdmin):
@@ -147,6 +144,8 @@ class ModelCostTrackingAdmin(admin.ModelAdmin):
         'user', 'date', 'model_name', 'generation_count',
         'total_cost_usd', 'avg_cost_per_generation'
     ]
+    list_select_related = ['user']
+    show_full_result_count = False
     list_filter = ['date', 'model_name']
     search_fields = ['user__email', 'model_name']
     date_hierarchy = 'date'
@@ -164,9 +163,6 @@ class ModelCostTrackingAdmin(admin.ModelAdmin):
         })
     )
 
-    def get_queryset(self, request):
-        return super().get_queryset(request).select_related('user')
-
 
 @admin.register(CircuitBreakerState)
 class CircuitBreakerStateAdmin(admin.ModelAdmin):
@@ -0,0 +1,35 @@
+# HNSW index for the cosine-distance searches in FlexibleEmbeddingService
+# (ORDER BY content_embedding <=> query). Only PostgreSQL with pgvector supports
+# it; other backends (SQLite in development and tests) skip the operation.
+
+from django.db import migrations
+
+CREATE_INDEX_SQL = """
+    CREATE INDEX IF NOT EXISTS enhanced_artifacts_content_embedding_hnsw
+    ON enhanced_artifacts USING hnsw (content_embedding vector_cosine_ops)
+    WITH (m = 16, ef_construction = 64)
+"""
+
+DROP_INDEX_SQL = "DROP INDEX IF EXISTS enhanced_artifacts_content_embedding_hnsw"
+
+
+def create_hnsw_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(CREATE_INDEX_SQL)
+
+
+def drop_hnsw_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(DROP_INDEX_SQL)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("llm_services", "0003_alter_artifactchunk_options_and_more"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_hnsw_index, drop_hnsw_index),
+    ]
@@ -0,0 +1,51 @@
+# Store enhanced artifact content embeddings as halfvec (FP16, pgvector >= 0.7).
+# The HNSW index from 0004 is rebuilt with the matching halfvec operator class.
+# Only PostgreSQL applies the column change; other backends just record the new state.
+
+from django.db import migrations
+import pgvector.django
+
+INDEX_NAME = 'enhanced_artifacts_content_embedding_hnsw'
+
+
+def _convert(schema_editor, column_type, opclass):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(f"DROP INDEX IF EXISTS {INDEX_NAME}")
+    schema_editor.execute(
+        f"ALTER TABLE enhanced_artifacts ALTER COLUMN content_embedding "
+        f"TYPE {column_type} USING content_embedding::{column_type}"
+    )
+    schema_editor.execute(
+        f"CREATE INDEX {INDEX_NAME} ON enhanced_artifacts "
+        f"USING hnsw (content_embedding {opclass}) WITH (m = 16, ef_construction = 64)"
+    )
+
+
+def to_halfvec(apps, schema_editor):
+    _convert(schema_editor, 'halfvec(1536)', 'halfvec_cosine_ops')
+
+
+def to_vector(apps, schema_editor):
+    _convert(schema_editor, 'vector(1536)', 'vector_cosine_ops')
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("llm_services", "0004_enhancedartifact_content_embedding_hnsw"),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunPython(to_halfvec, to_vector),
+            ],
+            state_operations=[
+                migrations.AlterField(
+                    model_name="enhancedartifact",
+                    name="content_embedding",
+                    field=pgvector.django.HalfVectorField(dimensions=1536),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:37
+
+from django.conf import settings
+from django.db import migrations, models
+
+# Metrics are append-only with created_at following insert order, so a BRIN index
+# covers time-window scans at a fraction of the btree's size. PostgreSQL only.
+BRIN_INDEX_NAME = 'model_perf_created_brin'
+
+
+def create_brin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        f"CREATE INDEX IF NOT EXISTS {BRIN_INDEX_NAME} ON model_performance_metrics "
+        f"USING brin (created_at) WITH (pages_per_range = 32)"
+    )
+
+
+def drop_brin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(f"DROP INDEX IF EXISTS {BRIN_INDEX_NAME}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('llm_services', '0005_enhancedartifact_content_embedding_halfvec'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='modelperformancemetric',
+            name='model_perfo_created_5bd507_idx',
+        ),
+        migrations.AddIndex(
+            model_name='modelperformancemetric',
+            index=models.Index(fields=['user', '-created_at'], name='model_perfo_user_id_ee6fa6_idx'),
+        ),
+        migrations.RunPython(create_brin_index, drop_brin_index),
+    ]
@@ -0,0 +1,61 @@
+# Store the remaining embedding columns as halfvec (FP16), matching content_embedding
+# from 0005. None of them is indexed, so the columns are converted in place.
+# Only PostgreSQL applies the column change; other backends just record the new state.
+
+from django.db import migrations
+import pgvector.django
+
+COLUMNS = [
+    ('enhanced_artifacts', 'summary_embedding'),
+    ('artifact_chunks', 'embedding_vector'),
+    ('job_embeddings', 'embedding_vector'),
+]
+
+
+def _convert(schema_editor, column_type):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for table, column in COLUMNS:
+        schema_editor.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"TYPE {column_type} USING {column}::{column_type}"
+        )
+
+
+def to_halfvec(apps, schema_editor):
+    _convert(schema_editor, 'halfvec(1536)')
+
+
+def to_vector(apps, schema_editor):
+    _convert(schema_editor, 'vector(1536)')
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("llm_services", "0006_modelperformancemetric_brin_created_at"),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunPython(to_halfvec, to_vector),
+            ],
+            state_operations=[
+                migrations.AlterField(
+                    model_name="enhancedartifact",
+                    name="summary_embedding",
+                    field=pgvector.django.HalfVectorField(dimensions=1536),
+                ),
+                migrations.AlterField(
+                    model_name="artifactchunk",
+                    name="embedding_vector",
+                    field=pgvector.django.HalfVectorField(dimensions=1536),
+                ),
+                migrations.AlterField(
+                    model_name="jobdescriptionembedding",
+                    name="embedding_vector",
+                    field=pgvector.django.HalfVectorField(dimensions=1536),
+                ),
+            ],
+        ),
+    ]
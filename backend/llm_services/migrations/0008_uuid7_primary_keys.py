@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:48
+
+import llm_services.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('llm_services', '0007_halfvec_embeddings'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='artifactchunk',
+            name='id',
+            field=models.UUIDField(default=llm_services.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='jobdescriptionembedding',
+            name='id',
+            field=models.UUIDField(default=llm_services.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='modelperformancemetric',
+            name='id',
+            field=models.UUIDField(default=llm_services.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
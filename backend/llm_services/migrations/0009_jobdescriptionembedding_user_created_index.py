@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:50
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('llm_services', '0008_uuid7_primary_keys'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='jobdescriptionembedding',
+            name='job_embeddi_created_66dd89_idx',
+        ),
+        migrations.AddIndex(
+            model_name='jobdescriptionembedding',
+            index=models.Index(fields=['user', '-created_at'], name='job_embeddi_user_id_f0482f_idx'),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Embeddings are now stored at unit length (NormalizedEmbeddingsMixin), so similarity
+# search ranks by inner product (<#>) instead of cosine distance. Existing rows are
+# normalized with pgvector's l2_normalize and the HNSW index from 0005 is rebuilt with
+# the inner-product operator class. Only PostgreSQL runs these statements.
+
+from django.db import migrations
+
+INDEX_NAME = 'enhanced_artifacts_content_embedding_hnsw'
+
+EMBEDDING_COLUMNS = [
+    ('enhanced_artifacts', 'content_embedding'),
+    ('enhanced_artifacts', 'summary_embedding'),
+    ('artifact_chunks', 'embedding_vector'),
+    ('job_embeddings', 'embedding_vector'),
+]
+
+
+def _rebuild_index(schema_editor, opclass):
+    schema_editor.execute(f"DROP INDEX IF EXISTS {INDEX_NAME}")
+    schema_editor.execute(
+        f"CREATE INDEX {INDEX_NAME} ON enhanced_artifacts "
+        f"USING hnsw (content_embedding {opclass}) WITH (m = 16, ef_construction = 64)"
+    )
+
+
+def normalize_and_use_inner_product(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for table, column in EMBEDDING_COLUMNS:
+        schema_editor.execute(
+            f"UPDATE {table} SET {column} = l2_normalize({column}) WHERE {column} IS NOT NULL"
+        )
+    _rebuild_index(schema_editor, 'halfvec_ip_ops')
+
+
+def use_cosine(apps, schema_editor):
+    # Normalized vectors rank identically under cosine distance, so the data stays as is
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    _rebuild_index(schema_editor, 'halfvec_cosine_ops')
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("llm_services", "0009_jobdescriptionembedding_user_created_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize_and_use_inner_product, use_cosine),
+    ]
@@ -3,8 +3,13 @@ Models for enhanced LLM services with pgvector support.
 Implements ft-llm-002-embedding-storage.md
 """
 
+import hashlib
+import os
+import time
 import uuid
-from django.db import models
+import numpy as np
+from django.db import connections, models, transaction
+from django.db.models import Case, F, Value, When
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 from django.contrib.postgres.fields import ArrayField
@@ -12,20 +17,64 @@ from django.core.validators import MinValueValidator, MaxValueValidator
 from decimal import Decimal
 
 try:
-    from pgvector.django import VectorField
+    from pgvector import HalfVector
+    from pgvector.django import HalfVectorField, MaxInnerProduct
     HAS_PGVECTOR = True
 except ImportError:
     # Fallback for development without pgvector
     HAS_PGVECTOR = False
-    VectorField = lambda dimensions: ArrayField(models.FloatField(), size=dimensions, default=list)
+    HalfVectorField = lambda dimensions: ArrayField(models.FloatField(), size=dimensions, default=list)
 
 User = get_user_model()
 
 
+def uuid7():
+    """
+    Time-ordered UUID (RFC 9562 version 7) for high-insert tables.
+
+    The leading 48 bits are the Unix time in milliseconds, so new keys land at the
+    right edge of the primary key index instead of at random pages like uuid4.
+    """
+    value = (time.time_ns() // 1_000_000) << 80
+    value |= int.from_bytes(os.urandom(10), 'big')
+    value &= ~(0xF << 76)
+    value |= 0x7 << 76  # version
+    value &= ~(0x3 << 62)
+    value |= 0x2 << 62  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
+def normalize_embedding(vector):
+    """Scale an embedding to unit L2 length; zero and empty vectors are returned as-is."""
+    if vector is None:
+        return None
+    values = np.asarray(vector.to_list() if hasattr(vector, 'to_list') else vector, dtype=np.float32)
+    norm = np.linalg.norm(values)
+    if norm:
+        values = values / norm
+    return values.tolist()
+
+
+class NormalizedEmbeddingsMixin:
+    """
+    Stores the fields named in `normalized_embedding_fields` at unit length, so the
+    inner product (pgvector `<#>`) equals cosine similarity without a per-row norm.
+    bulk_create() and queryset update() skip save() and must normalize themselves.
+    """
+    normalized_embedding_fields = ()
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        for name in self.normalized_embedding_fields:
+            if update_fields is None or name in update_fields:
+                setattr(self, name, normalize_embedding(getattr(self, name)))
+        super().save(*args, **kwargs)
+
+
 class ModelPerformanceMetric(models.Model):
     """Track performance metrics for different AI models"""
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     model_name = models.CharField(max_length=100, db_index=True)
     task_type = models.CharField(max_length=50, choices=[
         ('job_parsing', 'Job Description Parsing'),
@@ -60,9 +109,10 @@ class ModelPerformanceMetric(models.Model):
     class Meta:
         db_table = 'model_performance_metrics'
         ordering = ['-created_at']
+        # Global time-window scans use a BRIN index on created_at (migration 0006, PostgreSQL only)
         indexes = [
             models.Index(fields=['model_name', 'task_type']),
-            models.Index(fields=['created_at']),
+            models.Index(fields=['user', '-created_at']),
             models.Index(fields=['success']),
         ]
 
@@ -70,7 +120,7 @@ class ModelPerformanceMetric(models.Model):
         return f"{self.model_name} - {self.task_type} - {self.created_at}"
 
 
-class EnhancedArtifact(models.Model):
+class EnhancedArtifact(NormalizedEmbeddingsMixin, models.Model):
     """Enhanced artifact model with embedding support"""
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -95,8 +145,10 @@ class EnhancedArtifact(models.Model):
     processed_content = models.JSONField(default=dict)  # Structured achievements, skills
 
     # Embeddings (configurable dimensions)
-    content_embedding = VectorField(dimensions=1536) if HAS_PGVECTOR else ArrayField(models.FloatField(), size=1536, default=list)
-    summary_embedding = VectorField(dimensions=1536) if HAS_PGVECTOR else ArrayField(models.FloatField(), size=1536, default=list)
+    # Embeddings are stored as FP16 halfvec: half the bytes read per distance evaluation
+    content_embedding = HalfVectorField(dimensions=1536) if HAS_PGVECTOR else ArrayField(models.FloatField(), size=1536, default=list)
+    summary_embedding = HalfVectorField(dimensions=1536) if HAS_PGVECTOR else ArrayField(models.FloatField(), size=1536, default=list)
+    normalized_embedding_fields = ('content_embedding', 'summary_embedding')
 
     # Embedding metadata
     embedding_model = models.CharField(max_length=50, default='text-embedding-3-small')
@@ -125,24 +177,73 @@ class EnhancedArtifact(models.Model):
         ]
 
     def find_similar(self, query_embedding, limit=10):
-        """Find similar artifacts using vector similarity"""
-        if not HAS_PGVECTOR:
-            return EnhancedArtifact.objects.none()
-
-        return EnhancedArtifact.objects.filter(
-            user=self.user
-        ).annotate(
-            similarity=models.F('content_embedding').cosine_distance(query_embedding)
+        """
+        Find similar artifacts using vector similarity.
+
+        Always returns a list of at most `limit` artifacts, closest first, each with
+        `similarity` set to the negative inner product (lower is closer), whichever
+        database backend does the ranking.
+        """
+        queryset = EnhancedArtifact.objects.filter(user=self.user)
+        query_embedding = normalize_embedding(query_embedding)
+        if not HAS_PGVECTOR or connections[queryset.db].vendor != 'postgresql':
+            return self._rank_by_inner_product(queryset, query_embedding, limit)
+
+        return list(self._nearest_by_inner_product(queryset, query_embedding, limit))
+
+    @staticmethod
+    def _nearest_by_inner_product(queryset, query_embedding, limit):
+        """pgvector ORDER BY ... LIMIT query for find_similar on PostgreSQL"""
+        # Stored embeddings are unit length, so the negative inner product (<#>) ranks
+        # like cosine distance; halfvec query against the halfvec column so
+        # ORDER BY ... LIMIT can use the HNSW index
+        return queryset.annotate(
+            similarity=MaxInnerProduct('content_embedding', HalfVector(query_embedding))
         ).order_by('similarity')[:limit]
 
+    @staticmethod
+    def _rank_by_inner_product(queryset, query_embedding, limit):
+        """
+        In-memory ranking for databases without pgvector operators (SQLite in
+        development). Streams only (pk, embedding) pairs into a float32 matrix,
+        scores it with one matrix-vector product, then loads just the closest
+        artifacts with `similarity` set to the negative inner product. Rows with a
+        missing or empty embedding (or one of another dimension) are skipped.
+        """
+        query = np.asarray(query_embedding, dtype=np.float32)
+        pks, rows = [], []
+        embedded = queryset.exclude(content_embedding=[]).values_list('pk', 'content_embedding')
+        for pk, embedding in embedded.iterator(chunk_size=256):
+            if embedding is None:
+                continue
+            row = np.asarray(embedding.to_list() if hasattr(embedding, 'to_list') else embedding,
+                             dtype=np.float32)
+            if row.shape != query.shape:
+                continue
+            pks.append(pk)
+            rows.append(row)
+        if not pks:
+            return []
+
+        scores = np.vstack(rows) @ query
+        top = np.argsort(-scores, kind='stable')[:limit]
+        artifacts = queryset.in_bulk([pks[index] for index in top])
+
+        ranked = []
+        for index in top:
+            artifact = artifacts[pks[index]]
+            artifact.similarity = -float(scores[index])
+            ranked.append(artifact)
+        return ranked
+
     def __str__(self):
         return f"{self.title} ({self.content_type})"
 
 
-class ArtifactChunk(models.Model):
+class ArtifactChunk(NormalizedEmbeddingsMixin, models.Model):
     """Individual chunks of processed artifacts with embeddings"""
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     artifact = models.ForeignKey(
         EnhancedArtifact, on_delete=models.CASCADE, related_name='chunks'
     )
@@ -153,7 +254,8 @@ class ArtifactChunk(models.Model):
     metadata = models.JSONField(default=dict)
 
     # Embedding
-    embedding_vector = VectorField(dimensions=1536) if HAS_PGVECTOR else ArrayField(models.FloatField(), size=1536, default=list)
+    embedding_vector = HalfVectorField(dimensions=1536) if HAS_PGVECTOR else ArrayField(models.FloatField(), size=1536, default=list)
+    normalized_embedding_fields = ('embedding_vector',)
     content_hash = models.CharField(max_length=64)
 
     # Processing info
@@ -172,14 +274,32 @@ class ArtifactChunk(models.Model):
             models.Index(fields=['content_hash']),
         ]
 
+    @classmethod
+    def bulk_ingest(cls, artifact, chunks, batch_size=500):
+        """
+        Replace the artifact's chunks with `chunks`, a list of field-value dicts in
+        chunk order (content and embedding_vector required). Rows are written with
+        multi-row INSERTs instead of one get_or_create round trip per chunk.
+        """
+        instances = []
+        for index, values in enumerate(chunks):
+            values = dict(values)
+            values['embedding_vector'] = normalize_embedding(values['embedding_vector'])
+            values.setdefault('content_hash', hashlib.sha256(values['content'].encode()).hexdigest())
+            instances.append(cls(artifact=artifact, chunk_index=index, **values))
+
+        with transaction.atomic():
+            cls.objects.filter(artifact=artifact).delete()
+            return cls.objects.bulk_create(instances, batch_size=batch_size)
+
     def __str__(self):
         return f"{self.artifact.title} - Chunk {self.chunk_index}"
 
 
-class JobDescriptionEmbedding(models.Model):
+class JobDescriptionEmbedding(NormalizedEmbeddingsMixin, models.Model):
     """Cache embeddings for job descriptions to avoid regeneration"""
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.ForeignKey(User, on_delete=models.CASCADE)
 
     # Job description info
@@ -188,7 +308,8 @@ class JobDescriptionEmbedding(models.Model):
     role_title = models.CharField(max_length=200, blank=True)
 
     # Embedding
-    embedding_vector = VectorField(dimensions=1536) if HAS_PGVECTOR else ArrayField(models.FloatField(), size=1536, default=list)
+    embedding_vector = HalfVectorField(dimensions=1536) if HAS_PGVECTOR else ArrayField(models.FloatField(), size=1536, default=list)
+    normalized_embedding_fields = ('embedding_vector',)
 
     # Processing info
     model_used = models.CharField(max_length=50, default='text-embedding-3-small')
@@ -207,14 +328,18 @@ class JobDescriptionEmbedding(models.Model):
         indexes = [
             models.Index(fields=['job_description_hash']),
             models.Index(fields=['user', 'last_accessed']),
-            models.Index(fields=['created_at']),
+            models.Index(fields=['user', '-created_at']),
         ]
 
     def update_access(self):
         """Update access tracking"""
+        now = timezone.now()
+        # Increment in the database so concurrent cache hits are not lost
+        JobDescriptionEmbedding.objects.filter(pk=self.pk).update(
+            access_count=F('access_count') + 1, last_accessed=now
+        )
         self.access_count += 1
-        self.last_accessed = timezone.now()
-        self.save(update_fields=['access_count', 'last_accessed'])
+        self.last_accessed = now
 
     def __str__(self):
         return f"Job Embedding: {self.role_title} at {self.company_name}"
@@ -274,20 +399,38 @@ class CircuitBreakerState(models.Model):
 
     def record_failure(self):
         """Record a failure and update state if needed"""
+        now = timezone.now()
+        # Count and trip in one UPDATE so concurrent failures from other workers are not lost
+        updated = CircuitBreakerState.objects.filter(pk=self.pk).update(
+            failure_count=F('failure_count') + 1,
+            last_failure=now,
+            state=Case(
+                When(failure_count__gte=F('failure_threshold') - 1, then=Value('open')),
+                default=F('state')
+            ),
+            updated_at=now
+        )
+        if updated:
+            self.refresh_from_db(fields=['failure_count', 'last_failure', 'state', 'updated_at'])
+            return
+
+        # No row to update (never saved, or deleted meanwhile): count in memory and insert it
         self.failure_count += 1
-        self.last_failure = timezone.now()
-
+        self.last_failure = now
         if self.failure_count >= self.failure_threshold:
             self.state = 'open'
-
         self.save()
 
     def record_success(self):
         """Record a success and reset failure count"""
+        # Successes are the common case; skip the write when the breaker is already reset
+        if self.state == 'closed' and self.failure_count == 0 and self.last_failure is None:
+            return
+
         self.failure_count = 0
         self.state = 'closed'
         self.last_failure = None
-        self.save()
+        self.save(update_fields=['failure_count', 'last_failure', 'state', 'updated_at'])
 
     def should_attempt_request(self):
         """Check if we should attempt a request to this model"""
@@ -298,7 +441,7 @@ class CircuitBreakerState(models.Model):
             if self.last_failure and \
                (timezone.now() - self.last_failure).seconds >= self.timeout_duration:
                 self.state = 'half_open'
-                self.save()
+                self.save(update_fields=['state', 'updated_at'])
                 return True
             return False
         elif self.state == 'half_open':
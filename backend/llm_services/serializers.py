@@ -102,9 +102,13 @@ class EnhancedArtifactSerializer(serializers.ModelSerializer):
         ]
 
     def get_total_processing_cost(self, obj):
-        chunk_costs = obj.chunks.aggregate(
-            total=models.Sum('processing_cost_usd')
-        ).get('total', 0) or 0
+        # List views annotate chunk_cost_sum; fall back to a per-object aggregate otherwise
+        if hasattr(obj, 'chunk_cost_sum'):
+            chunk_costs = obj.chunk_cost_sum or 0
+        else:
+            chunk_costs = obj.chunks.aggregate(
+                total=models.Sum('processing_cost_usd')
+            ).get('total', 0) or 0
         return float(obj.embedding_cost_usd) + float(chunk_costs)
 
 
@@ -24,17 +24,27 @@ class CircuitBreakerManager:
         self.timeout_duration = self.config.get('timeout_duration', 30)  # seconds
         self.retry_attempts = self.config.get('retry_attempts', 3)
 
+    def _get_breaker(self, model_name: str) -> CircuitBreakerState:
+        """
+        Load the breaker row for a model, creating it with the configured limits.
+
+        Not cached between calls: other workers trip and reset the same row, and
+        an existing row costs one indexed SELECT.
+        """
+        breaker, _ = CircuitBreakerState.objects.get_or_create(
+            model_name=model_name,
+            defaults={
+                'failure_threshold': self.failure_threshold,
+                'timeout_duration': self.timeout_duration
+            }
+        )
+        return breaker
+
     @sync_to_async
     def can_attempt_request(self, model_name: str) -> bool:
         """Check if we should attempt a request to the given model"""
         try:
-            breaker, created = CircuitBreakerState.objects.get_or_create(
-                model_name=model_name,
-                defaults={
-                    'failure_threshold': self.failure_threshold,
-                    'timeout_duration': self.timeout_duration
-                }
-            )
+            breaker = self._get_breaker(model_name)
 
             return breaker.should_attempt_request()
 
@@ -47,13 +57,7 @@ class CircuitBreakerManager:
     def record_success(self, model_name: str) -> None:
         """Record a successful request for the model"""
         try:
-            breaker, created = CircuitBreakerState.objects.get_or_create(
-                model_name=model_name,
-                defaults={
-                    'failure_threshold': self.failure_threshold,
-                    'timeout_duration': self.timeout_duration
-                }
-            )
+            breaker = self._get_breaker(model_name)
 
             breaker.record_success()
             logger.debug(f"Circuit breaker for {model_name}: recorded success, reset to closed state")
@@ -65,13 +69,7 @@ class CircuitBreakerManager:
     def record_failure(self, model_name: str, error_type: Optional[str] = None) -> None:
         """Record a failure for the model"""
         try:
-            breaker, created = CircuitBreakerState.objects.get_or_create(
-                model_name=model_name,
-                defaults={
-                    'failure_threshold': self.failure_threshold,
-                    'timeout_duration': self.timeout_duration
-                }
-            )
+            breaker = self._get_breaker(model_name)
 
             breaker.record_failure()
 
@@ -87,13 +85,7 @@ class CircuitBreakerManager:
     def record_failure_sync(self, model_name: str, error_type: Optional[str] = None) -> None:
         """Record a failure for the model (synchronous version for tests)"""
         try:
-            breaker, created = CircuitBreakerState.objects.get_or_create(
-                model_name=model_name,
-                defaults={
-                    'failure_threshold': self.failure_threshold,
-                    'timeout_duration': self.timeout_duration
-                }
-            )
+            breaker = self._get_breaker(model_name)
 
             breaker.record_failure()
 
@@ -109,13 +101,7 @@ class CircuitBreakerManager:
     def record_success_sync(self, model_name: str) -> None:
         """Record a successful request for the model (synchronous version for tests)"""
         try:
-            breaker, created = CircuitBreakerState.objects.get_or_create(
-                model_name=model_name,
-                defaults={
-                    'failure_threshold': self.failure_threshold,
-                    'timeout_duration': self.timeout_duration
-                }
-            )
+            breaker = self._get_breaker(model_name)
 
             breaker.record_success()
             logger.debug(f"Circuit breaker for {model_name}: recorded success, reset to closed state")
@@ -126,13 +112,7 @@ class CircuitBreakerManager:
     def can_attempt_request_sync(self, model_name: str) -> bool:
         """Check if we should attempt a request to the given model (synchronous version for tests)"""
         try:
-            breaker, created = CircuitBreakerState.objects.get_or_create(
-                model_name=model_name,
-                defaults={
-                    'failure_threshold': self.failure_threshold,
-                    'timeout_duration': self.timeout_duration
-                }
-            )
+            breaker = self._get_breaker(model_name)
 
             return breaker.should_attempt_request()
 
@@ -141,27 +121,28 @@ class CircuitBreakerManager:
             # Default to allowing requests if breaker check fails
             return True
 
+    def can_attempt_requests(self, model_names: List[str]) -> Dict[str, bool]:
+        """Check several models with one query; a model without a breaker row has never failed"""
+        try:
+            breakers = {
+                breaker.model_name: breaker
+                for breaker in CircuitBreakerState.objects.filter(model_name__in=model_names)
+            }
+        except Exception as e:
+            logger.error(f"Error checking circuit breakers for {model_names}: {e}")
+            # Default to allowing requests if breaker check fails
+            return {model_name: True for model_name in model_names}
+
+        return {
+            model_name: breakers[model_name].should_attempt_request() if model_name in breakers else True
+            for model_name in model_names
+        }
+
     def get_breaker_status(self, model_name: str) -> Dict[str, any]:
         """Get current status of circuit breaker for a model"""
         try:
             breaker = CircuitBreakerState.objects.get(model_name=model_name)
-
-            time_since_failure = None
-            if breaker.last_failure:
-                time_since_failure = (timezone.now() - breaker.last_failure).total_seconds()
-
-            return {
-                'model_name': model_name,
-                'state': breaker.state,
-                'failure_count': breaker.failure_count,
-                'failure_threshold': breaker.failure_threshold,
-                'last_failure': breaker.last_failure.isoformat() if breaker.last_failure else None,
-                'time_since_failure_seconds': time_since_failure,
-                'timeout_duration_seconds': breaker.timeout_duration,
-                'can_attempt_request': breaker.should_attempt_request(),
-                'time_until_retry': max(0, breaker.timeout_duration - time_since_failure) if time_since_failure else 0,
-                'is_healthy': breaker.state == 'closed'
-            }
+            return self._status_from_instance(breaker)
 
         except CircuitBreakerState.DoesNotExist:
             return {
@@ -177,6 +158,25 @@ class CircuitBreakerManager:
                 'is_healthy': True
             }
 
+    def _status_from_instance(self, breaker: CircuitBreakerState) -> Dict[str, any]:
+        """Build the status dict from an already-loaded breaker row"""
+        time_since_failure = None
+        if breaker.last_failure:
+            time_since_failure = (timezone.now() - breaker.last_failure).total_seconds()
+
+        return {
+            'model_name': breaker.model_name,
+            'state': breaker.state,
+            'failure_count': breaker.failure_count,
+            'failure_threshold': breaker.failure_threshold,
+            'last_failure': breaker.last_failure.isoformat() if breaker.last_failure else None,
+            'time_since_failure_seconds': time_since_failure,
+            'timeout_duration_seconds': breaker.timeout_duration,
+            'can_attempt_request': breaker.should_attempt_request(),
+            'time_until_retry': max(0, breaker.timeout_duration - time_since_failure) if time_since_failure else 0,
+            'is_healthy': breaker.state == 'closed'
+        }
+
     async def get_breaker_status_async(self, model_name: str) -> Dict[str, any]:
         """Async version of get_breaker_status for use in async contexts"""
         return await sync_to_async(self.get_breaker_status)(model_name)
@@ -186,7 +186,7 @@ class CircuitBreakerManager:
         statuses = {}
 
         for breaker in CircuitBreakerState.objects.all():
-            statuses[breaker.model_name] = self.get_breaker_status(breaker.model_name)
+            statuses[breaker.model_name] = self._status_from_instance(breaker)
 
         return statuses
 
@@ -206,13 +206,14 @@ class CircuitBreakerManager:
         """Get failure statistics across all models"""
         since = timezone.now() - timedelta(days=days)
 
-        breakers = CircuitBreakerState.objects.all()
+        # model_details needs every row anyway, so count from the same list in one query
+        breakers = list(CircuitBreakerState.objects.all())
         stats = {
-            'total_models': breakers.count(),
-            'models_with_failures': breakers.filter(failure_count__gt=0).count(),
-            'models_circuit_open': breakers.filter(state='open').count(),
-            'models_half_open': breakers.filter(state='half_open').count(),
-            'recent_failures': breakers.filter(last_failure__gte=since).count(),
+            'total_models': len(breakers),
+            'models_with_failures': sum(1 for b in breakers if b.failure_count > 0),
+            'models_circuit_open': sum(1 for b in breakers if b.state == 'open'),
+            'models_half_open': sum(1 for b in breakers if b.state == 'half_open'),
+            'recent_failures': sum(1 for b in breakers if b.last_failure and b.last_failure >= since),
             'model_details': {}
         }
 
@@ -230,12 +231,11 @@ class CircuitBreakerManager:
 
     def should_use_fallback_strategy(self, primary_model: str, fallback_model: str) -> bool:
         """Determine if we should use fallback strategy based on circuit breaker states"""
-        primary_status = self.get_breaker_status(primary_model)
-        fallback_status = self.get_breaker_status(fallback_model)
+        availability = self.can_attempt_requests([primary_model, fallback_model])
 
         # Use fallback if primary is down and fallback is available
-        primary_available = primary_status['can_attempt_request']
-        fallback_available = fallback_status['can_attempt_request']
+        primary_available = availability[primary_model]
+        fallback_available = availability[fallback_model]
 
         if not primary_available and fallback_available:
             logger.info(f"Using fallback strategy: {primary_model} -> {fallback_model}")
@@ -250,19 +250,26 @@ class CircuitBreakerManager:
         registry = ModelRegistry()
         all_models = registry.MODELS.get('chat_models', {})
 
-        # Filter models with closed circuit breakers
+        candidates = [name for name, config in all_models.items() if not config.get('deprecated', False)]
+        breakers = {
+            breaker.model_name: breaker
+            for breaker in CircuitBreakerState.objects.filter(model_name__in=candidates)
+        }
+
+        # Filter models with closed circuit breakers; a model without a row has never failed
         available_models = []
 
-        for model_name in all_models.keys():
-            if not all_models[model_name].get('deprecated', False):
-                status = self.get_breaker_status(model_name)
-                if status['can_attempt_request']:
-                    available_models.append(model_name)
+        for model_name in candidates:
+            breaker = breakers.get(model_name)
+            if breaker is None:
+                available_models.append((model_name, 0))
+            elif breaker.should_attempt_request():
+                available_models.append((model_name, breaker.failure_count))
 
         # Sort by reliability (models with fewer failures first)
-        available_models.sort(key=lambda m: self.get_breaker_status(m)['failure_count'])
+        available_models.sort(key=lambda pair: pair[1])
 
-        return available_models
+        return [model_name for model_name, _ in available_models]
 
     def cleanup_old_states(self, days_to_keep: int = 30):
         """Clean up old circuit breaker states that haven't been used recently"""
@@ -24,11 +24,17 @@ except ImportError:
 from .model_registry import ModelRegistry
 from .model_selector import IntelligentModelSelector
 from .performance_tracker import ModelPerformanceTracker
-from ..models import EnhancedArtifact, ArtifactChunk, JobDescriptionEmbedding
+from ..models import EnhancedArtifact, ArtifactChunk, JobDescriptionEmbedding, normalize_embedding
 
 logger = logging.getLogger(__name__)
 
 
+def compute_job_hash(job_description: str, company_name: str = "", role_title: str = "") -> str:
+    """Cache key for a job description embedding (JobDescriptionEmbedding.job_description_hash)"""
+    job_text = f"{company_name} {role_title} {job_description}".strip()
+    return hashlib.sha256(job_text.encode()).hexdigest()
+
+
 class FlexibleEmbeddingService:
     """Service for generating and managing embeddings with intelligent model selection"""
 
@@ -191,34 +197,22 @@ class FlexibleEmbeddingService:
                     user_id=user_id
                 )
 
-                # Store chunk embeddings using sync_to_async
-                for i, (chunk, embedding_result) in enumerate(zip(chunks, chunk_embeddings)):
-                    content_hash = hashlib.sha256(chunk['content'].encode()).hexdigest()
-
-                    chunk_obj, chunk_created = await sync_to_async(ArtifactChunk.objects.get_or_create)(
-                        artifact=enhanced_artifact,
-                        chunk_index=i,
-                        defaults={
-                            'content': chunk['content'],
-                            'metadata': chunk.get('metadata', {}),
-                            'embedding_vector': embedding_result['embedding'],
-                            'content_hash': content_hash,
-                            'model_used': embedding_result['model_used'],
-                            'tokens_used': embedding_result['tokens_used'],
-                            'processing_cost_usd': embedding_result['cost_usd']
-                        }
-                    )
-
-                    if not chunk_created:
-                        # Update existing chunk
-                        chunk_obj.embedding_vector = embedding_result['embedding']
-                        chunk_obj.model_used = embedding_result['model_used']
-                        chunk_obj.tokens_used = embedding_result['tokens_used']
-                        chunk_obj.processing_cost_usd = embedding_result['cost_usd']
-                        await sync_to_async(chunk_obj.save)()
-
+                # Store all chunk embeddings in batched INSERTs
+                chunk_objs = await sync_to_async(ArtifactChunk.bulk_ingest)(enhanced_artifact, [
+                    {
+                        'content': chunk['content'],
+                        'metadata': chunk.get('metadata', {}),
+                        'embedding_vector': embedding_result['embedding'],
+                        'model_used': embedding_result['model_used'],
+                        'tokens_used': embedding_result['tokens_used'],
+                        'processing_cost_usd': embedding_result['cost_usd']
+                    }
+                    for chunk, embedding_result in zip(chunks, chunk_embeddings)
+                ])
+
+                for chunk_obj, embedding_result in zip(chunk_objs, chunk_embeddings):
                     chunk_results.append({
-                        'chunk_index': i,
+                        'chunk_index': chunk_obj.chunk_index,
                         'chunk_id': str(chunk_obj.id),
                         'embedding_dimensions': len(embedding_result['embedding']),
                         'cost_usd': embedding_result['cost_usd']
@@ -293,7 +287,7 @@ class FlexibleEmbeddingService:
 
         # Create hash for caching
         job_text = f"{company_name} {role_title} {job_description}".strip()
-        job_hash = hashlib.sha256(job_text.encode()).hexdigest()
+        job_hash = compute_job_hash(job_description, company_name, role_title)
 
         try:
             # Check if embedding already exists
@@ -306,7 +300,7 @@ class FlexibleEmbeddingService:
                 logger.info(f"Using cached job embedding (hash: {job_hash[:8]}...)")
 
                 return {
-                    'embedding': cached_embedding.embedding_vector,
+                    'embedding': cached_embedding.embedding_vector.to_list(),
                     'model_used': cached_embedding.model_used,
                     'dimensions': cached_embedding.dimensions,
                     'cost_usd': 0.0,  # No cost for cached embedding
@@ -386,9 +380,13 @@ class FlexibleEmbeddingService:
                 where_conditions.append("ea.content_type = ANY(%s)")
                 params.append(content_types)
 
+            # Stored embeddings are unit length, so the negative inner product (<#>) is
+            # -cosine similarity and needs no per-row norm
+            query_embedding = normalize_embedding(query_embedding)
+
             # Add similarity threshold
-            where_conditions.append("ea.content_embedding <=> %s::vector < %s")
-            params.extend([query_embedding, 1 - similarity_threshold])
+            where_conditions.append("ea.content_embedding <#> %s::halfvec < %s")
+            params.extend([query_embedding, -similarity_threshold])
 
             where_clause = " AND ".join(where_conditions)
             params.append(query_embedding)  # For ORDER BY
@@ -402,13 +400,13 @@ class FlexibleEmbeddingService:
                         ea.id,
                         ea.title,
                         ea.content_type,
-                        ea.content_embedding <=> %s::vector as similarity_distance,
-                        1 - (ea.content_embedding <=> %s::vector) as similarity_score,
+                        1 + (ea.content_embedding <#> %s::halfvec) as similarity_distance,
+                        -(ea.content_embedding <#> %s::halfvec) as similarity_score,
                         ea.embedding_model,
                         ea.created_at
                     FROM enhanced_artifacts ea
                     WHERE {where_clause}
-                    ORDER BY ea.content_embedding <=> %s::vector
+                    ORDER BY ea.content_embedding <#> %s::halfvec
                     LIMIT %s
                 """
 
@@ -446,6 +444,8 @@ class FlexibleEmbeddingService:
         try:
             from django.db import connection
 
+            job_embedding = normalize_embedding(job_embedding)
+
             with connection.cursor() as cursor:
                 start_time = time.time()
 
@@ -454,12 +454,12 @@ class FlexibleEmbeddingService:
                         ea.id,
                         ea.title,
                         ea.content_type,
-                        ea.content_embedding <=> %s::vector as relevance_distance,
-                        1 - (ea.content_embedding <=> %s::vector) as relevance_score,
+                        1 + (ea.content_embedding <#> %s::halfvec) as relevance_distance,
+                        -(ea.content_embedding <#> %s::halfvec) as relevance_score,
                         ea.embedding_model
                     FROM enhanced_artifacts ea
                     WHERE ea.user_id = %s AND ea.id = ANY(%s)
-                    ORDER BY ea.content_embedding <=> %s::vector
+                    ORDER BY ea.content_embedding <#> %s::halfvec
                 """
 
                 params = [
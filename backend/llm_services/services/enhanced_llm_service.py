@@ -7,6 +7,7 @@ import json
 import time
 import logging
 import asyncio
+import numpy as np
 from typing import Dict, List, Any, Optional
 from django.conf import settings
 from django.utils import timezone
@@ -593,25 +594,33 @@ class EnhancedLLMService:
             from .embedding_service import FlexibleEmbeddingService
             embedding_service = FlexibleEmbeddingService()
 
-            # Generate embeddings for each artifact if they don't have them
+            # Embed all artifacts that don't have an embedding yet in one batched request
+            pending = []
             for artifact in artifacts:
                 if 'embedding' not in artifact:
-                    # Create text representation of artifact
                     artifact_text = f"{artifact.get('title', '')} {artifact.get('description', '')} {' '.join(artifact.get('technologies', []))}"
                     if artifact_text.strip():
-                        embedding_results = await embedding_service.generate_embeddings([artifact_text], use_case='similarity', user_id=user_id)
-                        if embedding_results and embedding_results[0].get('embedding'):
-                            artifact['embedding'] = embedding_results[0]['embedding']
-
-                # Calculate cosine similarity with job embedding
-                if 'embedding' in artifact:
-                    artifact_embedding = artifact['embedding']
-                    similarity = self._cosine_similarity(job_embedding, artifact_embedding)
+                        pending.append((artifact, artifact_text))
+
+            if pending:
+                embedding_results = await embedding_service.generate_embeddings(
+                    [text for _, text in pending], use_case='similarity', user_id=user_id
+                )
+                for result in embedding_results:
+                    if result.get('embedding'):
+                        pending[result['text_index']][0]['embedding'] = result['embedding']
+
+            # Score every embedded artifact with a single matrix-vector product
+            query = np.asarray(job_embedding, dtype=np.float64)
+            embedded = [a for a in artifacts if 'embedding' in a and len(a['embedding']) == len(query)]
+            for artifact in artifacts:
+                # Missing embeddings get a neutral score; mismatched dimensions can't be compared
+                artifact['relevance_score'] = 0.0 if 'embedding' in artifact else 5.0
+
+            if embedded:
+                for artifact, similarity in zip(embedded, self._cosine_similarities(query, [a['embedding'] for a in embedded])):
                     # Convert similarity to 0-10 scale
-                    artifact['relevance_score'] = round(similarity * 10, 2)
-                else:
-                    # Fallback to basic score if no embedding available
-                    artifact['relevance_score'] = 5.0
+                    artifact['relevance_score'] = round(float(similarity) * 10, 2)
 
             # Sort by relevance score
             return sorted(artifacts, key=lambda x: x.get('relevance_score', 0), reverse=True)
@@ -624,21 +633,12 @@ class EnhancedLLMService:
                 artifact['relevance_score'] = max(1.0, 10.0 - (i * 1.0))
             return sorted(artifacts, key=lambda x: x.get('relevance_score', 0), reverse=True)
 
-    def _cosine_similarity(self, vec1: List[float], vec2: List[float]) -> float:
-        """Calculate cosine similarity between two vectors"""
-        import math
-
-        if len(vec1) != len(vec2):
-            return 0.0
-
-        dot_product = sum(a * b for a, b in zip(vec1, vec2))
-        magnitude1 = math.sqrt(sum(a * a for a in vec1))
-        magnitude2 = math.sqrt(sum(b * b for b in vec2))
-
-        if magnitude1 == 0.0 or magnitude2 == 0.0:
-            return 0.0
-
-        return dot_product / (magnitude1 * magnitude2)
+    def _cosine_similarities(self, query: np.ndarray, vectors: List[List[float]]) -> np.ndarray:
+        """Cosine similarity of each row vector against the query; zero vectors score 0.0"""
+        matrix = np.asarray(vectors, dtype=np.float64)
+        norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)
+        dots = matrix @ query
+        return np.divide(dots, norms, out=np.zeros_like(dots), where=norms != 0)
 
     def _get_api_key_for_model(self, model_name: str) -> str:
         """Get appropriate API key for model"""
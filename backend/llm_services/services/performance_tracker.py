@@ -7,8 +7,9 @@ import logging
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
 from django.utils import timezone
-from django.db.models import Avg, Count, Sum, Q
-from django.db import transaction
+from decimal import Decimal
+from django.db.models import Avg, Count, F, Sum, Q
+from django.db import IntegrityError, transaction
 from asgiref.sync import sync_to_async
 
 from ..models import ModelPerformanceMetric, ModelCostTracking
@@ -75,33 +76,37 @@ class ModelPerformanceTracker:
     def _update_daily_cost_tracking_sync(self, user_id: int, model_name: str, cost_usd: float, tokens_used: int):
         """Synchronous version of daily cost tracking update"""
         today = timezone.now().date()
+        cost = Decimal(str(cost_usd))
+        daily_row = ModelCostTracking.objects.filter(user_id=user_id, date=today, model_name=model_name)
+
+        # Accumulate in one UPDATE so concurrent calls for the same user/model/day are not lost;
+        # the right-hand side reads the pre-update values, so the averages include this call
+        new_count = F('generation_count') + 1
+        increment = dict(
+            total_cost_usd=F('total_cost_usd') + cost,
+            generation_count=new_count,
+            avg_cost_per_generation=(F('total_cost_usd') + cost) / new_count,
+            total_tokens_used=F('total_tokens_used') + tokens_used,
+            avg_tokens_per_generation=(F('total_tokens_used') + tokens_used) / new_count,
+        )
+        if daily_row.update(**increment):
+            return
 
-        with transaction.atomic():
-            cost_tracking, created = ModelCostTracking.objects.get_or_create(
-                user_id=user_id,
-                date=today,
-                model_name=model_name,
-                defaults={
-                    'total_cost_usd': cost_usd,
-                    'generation_count': 1,
-                    'avg_cost_per_generation': cost_usd,
-                    'total_tokens_used': tokens_used,
-                    'avg_tokens_per_generation': tokens_used
-                }
-            )
-
-            if not created:
-                # Update existing record
-                new_generation_count = cost_tracking.generation_count + 1
-                new_total_cost = float(cost_tracking.total_cost_usd) + cost_usd
-                new_total_tokens = int(cost_tracking.total_tokens_used) + tokens_used
-
-                cost_tracking.total_cost_usd = new_total_cost
-                cost_tracking.generation_count = new_generation_count
-                cost_tracking.avg_cost_per_generation = float(new_total_cost) / new_generation_count
-                cost_tracking.total_tokens_used = new_total_tokens
-                cost_tracking.avg_tokens_per_generation = int(float(new_total_tokens) / new_generation_count)
-                cost_tracking.save()
+        try:
+            with transaction.atomic():
+                ModelCostTracking.objects.create(
+                    user_id=user_id,
+                    date=today,
+                    model_name=model_name,
+                    total_cost_usd=cost,
+                    generation_count=1,
+                    avg_cost_per_generation=cost,
+                    total_tokens_used=tokens_used,
+                    avg_tokens_per_generation=tokens_used
+                )
+        except IntegrityError:
+            # Another call created today's row first
+            daily_row.update(**increment)
 
     def get_model_performance_summary(self, days: int = 7) -> Dict[str, Dict[str, Any]]:
         """Get performance summary for all models over specified days"""
@@ -10,7 +10,7 @@ from django.test import override_settings
 from unittest.mock import Mock, patch
 
 # Configure Django settings
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'cv_tailor.settings')
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'cv_tailor.settings_test')
 django.setup()
 
 from django.contrib.auth import get_user_model
@@ -93,7 +93,7 @@ def mock_langchain():
 @pytest.fixture
 def mock_pgvector():
     """Mock pgvector operations."""
-    with patch('llm_services.models.VectorField', create=True) as mock_vector_field:
+    with patch('llm_services.models.HalfVectorField', create=True) as mock_vector_field:
         mock_vector_field.return_value = Mock()
         yield mock_vector_field
 
@@ -118,8 +118,7 @@ def mock_celery_task():
     return task
 
 
-@pytest.fixture
-@override_settings(
+TEST_SETTINGS_OVERRIDES = dict(
     # Test settings overrides
     CELERY_TASK_ALWAYS_EAGER=True,
     CELERY_TASK_EAGER_PROPAGATES=True,
@@ -138,9 +137,15 @@ def mock_celery_task():
         'paid_tier': {'daily_limit_usd': 10.0}
     }
 )
+
+
+@pytest.fixture(scope='session')
 def test_settings():
-    """Test-specific Django settings."""
+    """Test-specific Django settings, applied once for the whole session."""
+    override = override_settings(**TEST_SETTINGS_OVERRIDES)
+    override.enable()
     yield
+    override.disable()
 
 
 # Async test fixture for asyncio tests
@@ -9,7 +9,7 @@ from django.test import TestCase
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 from django.core.exceptions import ValidationError
-from django.db import IntegrityError
+from django.db import IntegrityError, connection
 from unittest.mock import patch
 
 from ..models import (
@@ -18,7 +18,8 @@ from ..models import (
     ArtifactChunk,
     JobDescriptionEmbedding,
     ModelCostTracking,
-    CircuitBreakerState
+    CircuitBreakerState,
+    uuid7,
 )
 
 User = get_user_model()
@@ -56,6 +57,22 @@ class ModelPerformanceMetricTestCase(TestCase):
         self.assertEqual(metric.user, self.user)
         self.assertTrue(isinstance(metric.id, uuid.UUID))
 
+    def test_performance_metric_ids_are_time_ordered(self):
+        """Test metric keys are version 7 UUIDs that sort by creation time"""
+        with patch('llm_services.models.time.time_ns', return_value=1_700_000_000_000_000_000):
+            earlier = uuid7()
+        metric = ModelPerformanceMetric.objects.create(
+            model_name='gpt-4o',
+            task_type='cv_generation',
+            processing_time_ms=1500,
+            cost_usd=Decimal('0.008'),
+            user=self.user
+        )
+
+        self.assertEqual(metric.id.version, 7)
+        self.assertEqual(metric.id.variant, uuid.RFC_4122)
+        self.assertLess(earlier, metric.id)
+
     def test_performance_metric_validation(self):
         """Test validation constraints"""
         # Test invalid quality score
@@ -140,6 +157,64 @@ class EnhancedArtifactTestCase(TestCase):
         expected = "My Portfolio (github)"
         self.assertEqual(str(artifact), expected)
 
+    def test_find_similar_orders_by_inner_product(self):
+        """Test similarity search builds an inner-product ORDER BY ... LIMIT"""
+        queryset = EnhancedArtifact.objects.filter(user=self.user)
+
+        # Only the query is inspected; the <#> operator needs PostgreSQL to execute
+        query = EnhancedArtifact._nearest_by_inner_product(queryset, [0.1] * 1536, 5).query
+        sql = str(query)
+
+        self.assertIn('<#>', sql)
+        self.assertEqual(query.order_by, ('similarity',))
+        self.assertIn('LIMIT 5', sql)
+
+    def test_find_similar_returns_list_on_postgresql(self):
+        """Test the pgvector path returns a list, like the in-memory fallback"""
+        artifact = EnhancedArtifact(user=self.user, title='Query', content_type='text')
+
+        with patch.object(connection, 'vendor', 'postgresql'), \
+                patch.object(EnhancedArtifact, '_nearest_by_inner_product',
+                             return_value=EnhancedArtifact.objects.none()) as nearest:
+            results = artifact.find_similar([0.1] * 1536, limit=5)
+
+        self.assertEqual(results, [])
+        self.assertIsInstance(results, list)
+        self.assertEqual(nearest.call_args.args[2], 5)
+
+    def test_find_similar_ranks_in_memory_without_pgvector_operators(self):
+        """Test similarity search falls back to NumPy ranking on other databases"""
+        def embedding(*head):
+            return list(head) + [0.0] * (1536 - len(head))
+
+        for title, head in [('Distant', (0.1, 1.0)), ('Exact', (2.0, 0.0)),
+                            ('Close', (1.0, 1.0)), ('Empty', ())]:
+            EnhancedArtifact.objects.create(user=self.user, title=title, content_type='text', raw_content='',
+                                            content_embedding=embedding(*head), summary_embedding=embedding())
+
+        # The fallback ArrayField defaults to an empty list for artifacts not yet embedded
+        EnhancedArtifact.objects.create(user=self.user, title='Unembedded', content_type='text', raw_content='',
+                                        content_embedding=[], summary_embedding=[])
+
+        results = EnhancedArtifact(user=self.user).find_similar(embedding(3.0, 0.0), limit=3)
+
+        self.assertEqual([a.title for a in results], ['Exact', 'Close', 'Distant'])
+        # Stored and query vectors are unit length, so an exact match scores -1
+        self.assertAlmostEqual(results[0].similarity, -1.0, places=3)
+        self.assertAlmostEqual(results[1].similarity, -(2 ** -0.5), places=3)
+
+    def test_save_normalizes_embeddings(self):
+        """Test embeddings are stored at unit length and zero vectors are left alone"""
+        artifact = EnhancedArtifact.objects.create(
+            user=self.user, title='Scaled', content_type='text', raw_content='',
+            content_embedding=[3.0, 4.0] + [0.0] * 1534, summary_embedding=[0.0] * 1536
+        )
+        artifact.refresh_from_db()
+
+        self.assertAlmostEqual(artifact.content_embedding[0], 0.6, places=5)
+        self.assertAlmostEqual(artifact.content_embedding[1], 0.8, places=5)
+        self.assertEqual(list(artifact.summary_embedding), [0.0] * 1536)
+
 
 class ArtifactChunkTestCase(TestCase):
     def setUp(self):
@@ -174,6 +249,32 @@ class ArtifactChunkTestCase(TestCase):
         self.assertEqual(chunk.content, 'First chunk of content...')
         self.assertEqual(chunk.tokens_used, 50)
 
+    def test_bulk_ingest_replaces_chunks(self):
+        """Test bulk ingestion writes chunks in order and drops the previous set"""
+        for index in range(3):
+            ArtifactChunk.objects.create(
+                artifact=self.artifact,
+                chunk_index=index,
+                content=f'Old chunk {index}',
+                content_hash=f'old{index}',
+                embedding_vector=[0.0] * 1536
+            )
+
+        chunks = [
+            {'content': 'New chunk 0', 'embedding_vector': [3.0, 4.0] + [0.0] * 1534, 'tokens_used': 10},
+            {'content': 'New chunk 1', 'embedding_vector': [0.0, 2.0] + [0.0] * 1534, 'tokens_used': 20},
+        ]
+        # Savepoint, one DELETE, one multi-row INSERT and release
+        with self.assertNumQueries(4):
+            created = ArtifactChunk.bulk_ingest(self.artifact, chunks)
+
+        self.assertEqual([c.chunk_index for c in created], [0, 1])
+        stored = list(ArtifactChunk.objects.filter(artifact=self.artifact))
+        self.assertEqual([c.content for c in stored], ['New chunk 0', 'New chunk 1'])
+        self.assertEqual(stored[1].tokens_used, 20)
+        self.assertEqual(len(stored[0].content_hash), 64)
+        self.assertAlmostEqual(stored[0].embedding_vector[0], 0.6, places=5)
+
     def test_chunk_unique_constraint(self):
         """Test unique constraint on artifact + chunk_index"""
         ArtifactChunk.objects.create(
@@ -269,6 +370,21 @@ class JobDescriptionEmbeddingTestCase(TestCase):
         embedding.refresh_from_db()
         self.assertEqual(embedding.access_count, 2)
 
+    def test_update_access_does_not_lose_concurrent_hits(self):
+        """Test update_access increments in the database rather than from a stale copy"""
+        embedding = JobDescriptionEmbedding.objects.create(
+            user=self.user,
+            job_description_hash='concurrent_hash',
+            embedding_vector=[0.0] * 1536
+        )
+        stale_copy = JobDescriptionEmbedding.objects.get(pk=embedding.pk)
+
+        embedding.update_access()
+        stale_copy.update_access()
+
+        embedding.refresh_from_db()
+        self.assertEqual(embedding.access_count, 3)
+
     def test_job_embedding_str_representation(self):
         """Test string representation"""
         embedding = JobDescriptionEmbedding.objects.create(
@@ -394,6 +510,36 @@ class CircuitBreakerStateTestCase(TestCase):
         self.assertEqual(breaker.failure_count, 5)
         self.assertEqual(breaker.state, 'open')
 
+    def test_record_failure_counts_failures_from_stale_instances(self):
+        """Test failures recorded through separately loaded instances all count"""
+        CircuitBreakerState.objects.create(model_name='test-model', failure_threshold=2)
+        first = CircuitBreakerState.objects.get(model_name='test-model')
+        second = CircuitBreakerState.objects.get(model_name='test-model')
+
+        first.record_failure()
+        second.record_failure()
+
+        self.assertEqual(second.failure_count, 2)
+        self.assertEqual(second.state, 'open')
+
+    def test_record_failure_without_stored_row(self):
+        """Test recording failure on an unsaved or concurrently deleted breaker saves it"""
+        unsaved = CircuitBreakerState(model_name='unsaved-model', failure_threshold=1)
+        unsaved.record_failure()
+
+        deleted = CircuitBreakerState.objects.create(model_name='deleted-model', failure_count=2)
+        CircuitBreakerState.objects.filter(pk=deleted.pk).delete()
+        deleted.record_failure()
+
+        self.assertEqual(unsaved.failure_count, 1)
+        self.assertEqual(unsaved.state, 'open')
+        self.assertEqual(deleted.failure_count, 3)
+        self.assertEqual(deleted.state, 'closed')
+        self.assertEqual(
+            dict(CircuitBreakerState.objects.values_list('model_name', 'failure_count')),
+            {'unsaved-model': 1, 'deleted-model': 3}
+        )
+
     def test_record_success(self):
         """Test recording success"""
         breaker = CircuitBreakerState.objects.create(
@@ -408,6 +554,10 @@ class CircuitBreakerStateTestCase(TestCase):
         self.assertEqual(breaker.state, 'closed')
         self.assertIsNone(breaker.last_failure)
 
+        # A success on an already reset breaker writes nothing
+        with self.assertNumQueries(0):
+            breaker.record_success()
+
     def test_can_attempt_request(self):
         """Test should_attempt_request logic"""
         breaker = CircuitBreakerState.objects.create(
@@ -494,7 +494,7 @@ if __name__ == '__main__':
     from django.test.utils import get_runner
 
     if not settings.configured:
-        os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'cv_tailor.settings')
+        os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'cv_tailor.settings_test')
         django.setup()
 
     TestRunner = get_runner(settings)
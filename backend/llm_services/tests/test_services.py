@@ -5,9 +5,10 @@ Unit tests for LLM services.
 import json
 import asyncio
 import uuid
+from datetime import timedelta
 from decimal import Decimal
 from unittest.mock import Mock, patch, AsyncMock, MagicMock
-from django.test import TestCase, override_settings
+from django.test import SimpleTestCase, TestCase, override_settings
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.utils import timezone
@@ -19,10 +20,40 @@ from ..services.document_processor import AdvancedDocumentProcessor
 from ..services.performance_tracker import ModelPerformanceTracker
 from ..services.circuit_breaker import CircuitBreakerManager
 from ..services.model_registry import ModelRegistry
-from ..models import ModelPerformanceMetric, CircuitBreakerState, JobDescriptionEmbedding
+from ..models import (
+    ModelPerformanceMetric, CircuitBreakerState, JobDescriptionEmbedding, ModelCostTracking,
+)
 
 User = get_user_model()
 
+# Canned chat completion payloads, serialized once at import
+MOCK_JOB_PARSE_JSON = json.dumps({
+    'company_name': 'Tech Corp',
+    'role_title': 'Senior Developer',
+    'must_have_skills': ['Python', 'Django'],
+    'nice_to_have_skills': ['React'],
+    'key_responsibilities': ['Develop web applications'],
+    'confidence_score': 0.9
+})
+
+MOCK_CV_CONTENT_JSON = json.dumps({
+    'professional_summary': 'Experienced developer...',
+    'key_skills': ['Python', 'Django', 'React'],
+    'work_experience': [{'title': 'Developer', 'company': 'Tech Corp'}],
+    'achievements': ['Built scalable applications']
+})
+
+
+def _mock_chat_response(content, prompt_tokens, completion_tokens):
+    """Build a chat completion response mock carrying the given content and usage"""
+    mock_response = Mock()
+    mock_response.choices = [Mock()]
+    mock_response.choices[0].message.content = content
+    mock_response.usage.prompt_tokens = prompt_tokens
+    mock_response.usage.completion_tokens = completion_tokens
+    mock_response.usage.total_tokens = prompt_tokens + completion_tokens
+    return mock_response
+
 
 class EnhancedLLMServiceTestCase(TestCase):
     def setUp(self):
@@ -55,23 +86,10 @@ class EnhancedLLMServiceTestCase(TestCase):
                 mock_select.assert_called_once()
                 mock_reason.assert_called_once()
 
-    @override_settings(OPENAI_API_KEY='test-key-123')
     async def test_parse_job_description(self):
         """Test job description parsing"""
         # Mock _direct_api_call response
-        mock_response = Mock()
-        mock_response.choices = [Mock()]
-        mock_response.choices[0].message.content = json.dumps({
-            'company_name': 'Tech Corp',
-            'role_title': 'Senior Developer',
-            'must_have_skills': ['Python', 'Django'],
-            'nice_to_have_skills': ['React'],
-            'key_responsibilities': ['Develop web applications'],
-            'confidence_score': 0.9
-        })
-        mock_response.usage.prompt_tokens = 100
-        mock_response.usage.completion_tokens = 200
-        mock_response.usage.total_tokens = 300
+        mock_response = _mock_chat_response(MOCK_JOB_PARSE_JSON, 100, 200)
 
         with patch.object(self.llm_service.model_selector, 'select_model_for_task') as mock_select, \
              patch.object(self.llm_service, '_direct_api_call', return_value=mock_response) as mock_direct_api:
@@ -121,17 +139,9 @@ class EnhancedLLMServiceTestCase(TestCase):
         # Mock OpenAI response
         mock_client = Mock()
         mock_openai.return_value = mock_client
-        mock_response = Mock()
-        mock_response.choices = [Mock()]
-        mock_response.choices[0].message.content = json.dumps({
-            'professional_summary': 'Experienced developer...',
-            'key_skills': ['Python', 'Django', 'React'],
-            'work_experience': [{'title': 'Developer', 'company': 'Tech Corp'}],
-            'achievements': ['Built scalable applications']
-        })
-        mock_response.usage.prompt_tokens = 200
-        mock_response.usage.completion_tokens = 400
-        mock_client.chat.completions.create.return_value = mock_response
+        mock_client.chat.completions.create.return_value = _mock_chat_response(
+            MOCK_CV_CONTENT_JSON, 200, 400
+        )
 
         job_data = {
             'must_have_skills': ['Python', 'Django'],
@@ -151,6 +161,32 @@ class EnhancedLLMServiceTestCase(TestCase):
             self.assertIn('processing_metadata', result)
 
 
+    @patch('llm_services.services.embedding_service.FlexibleEmbeddingService.generate_embeddings')
+    async def test_semantic_ranking_batches_embeddings(self, mock_generate):
+        """Test semantic ranking embeds artifacts in one call and scores by cosine similarity"""
+        mock_generate.return_value = [
+            {'embedding': [0.0, 1.0], 'text_index': 0},
+            {'embedding': [1.0, 1.0], 'text_index': 1},
+        ]
+        artifacts = [
+            {'title': 'Unrelated project'},
+            {'title': 'Partly related project'},
+            {'title': 'Exact match', 'embedding': [1.0, 0.0]},
+            {'title': 'Other model', 'embedding': [1.0, 0.0, 0.0]},
+            {'title': ''},
+        ]
+
+        ranked = await self.llm_service._semantic_ranking(artifacts, [1.0, 0.0], self.user.id)
+
+        mock_generate.assert_called_once()
+        self.assertEqual(len(mock_generate.call_args[0][0]), 2)
+        self.assertEqual(
+            [(a['title'], a['relevance_score']) for a in ranked],
+            [('Exact match', 10.0), ('Partly related project', 7.07), ('', 5.0),
+             ('Unrelated project', 0.0), ('Other model', 0.0)]
+        )
+
+
 class FlexibleEmbeddingServiceTestCase(TestCase):
     def setUp(self):
         self.user = User.objects.create_user(
@@ -446,6 +482,18 @@ class ModelPerformanceTrackerTestCase(TestCase):
         self.assertEqual(metric.processing_time_ms, 1500)
         self.assertEqual(metric.success, True)
 
+    def test_daily_cost_tracking_accumulates(self):
+        """Test per-call cost tracking creates today's row, then increments it"""
+        self.tracker._update_daily_cost_tracking_sync(self.user.id, 'gpt-4o', 0.004, 300)
+        self.tracker._update_daily_cost_tracking_sync(self.user.id, 'gpt-4o', 0.008, 600)
+
+        tracking = ModelCostTracking.objects.get(user=self.user, model_name='gpt-4o')
+        self.assertEqual(tracking.generation_count, 2)
+        self.assertEqual(tracking.total_cost_usd, Decimal('0.012'))
+        self.assertEqual(tracking.avg_cost_per_generation, Decimal('0.006'))
+        self.assertEqual(tracking.total_tokens_used, 900)
+        self.assertEqual(tracking.avg_tokens_per_generation, 450)
+
     def test_get_model_performance_stats(self):
         """Test getting performance statistics"""
         # Create test metrics
@@ -552,6 +600,48 @@ class CircuitBreakerManagerTestCase(TestCase):
         result = await self.service.can_attempt_request('broken-model')
         self.assertFalse(result)
 
+    def test_hot_path_reads_breaker_once(self):
+        """Test steady-state success and request checks cost a single SELECT each"""
+        model_name = 'hot-path-model'
+        self.service.record_success_sync(model_name)
+
+        with self.assertNumQueries(1):
+            self.service.record_success_sync(model_name)
+        with self.assertNumQueries(1):
+            self.assertTrue(self.service.can_attempt_request_sync(model_name))
+
+        # A breaker tripped elsewhere is seen on the next check
+        CircuitBreakerState.objects.filter(model_name=model_name).update(
+            state='open', last_failure=timezone.now()
+        )
+        self.assertFalse(self.service.can_attempt_request_sync(model_name))
+
+    def test_get_recommended_models(self):
+        """Test recommendations skip open breakers and deprecated models in one query"""
+        CircuitBreakerState.objects.create(model_name='gpt-4o', state='open', failure_count=5,
+                                           last_failure=timezone.now())
+        CircuitBreakerState.objects.create(model_name='gpt-4o-mini', state='closed', failure_count=2)
+        CircuitBreakerState.objects.create(model_name='claude-opus-4-1-20250805', state='half_open',
+                                           failure_count=1)
+
+        with self.assertNumQueries(1):
+            models = self.service.get_recommended_models()
+
+        self.assertEqual(models, ['claude-sonnet-4-20250514', 'claude-opus-4-1-20250805', 'gpt-4o-mini'])
+
+    def test_should_use_fallback_strategy(self):
+        """Test the fallback decision checks both breakers in one query"""
+        CircuitBreakerState.objects.create(model_name='fallback-primary', state='open', failure_count=5,
+                                           last_failure=timezone.now())
+
+        with self.assertNumQueries(1):
+            self.assertTrue(self.service.should_use_fallback_strategy('fallback-primary', 'fallback-spare'))
+        self.assertEqual(
+            self.service.can_attempt_requests(['fallback-spare', 'fallback-primary']),
+            {'fallback-spare': True, 'fallback-primary': False}
+        )
+        self.assertFalse(self.service.should_use_fallback_strategy('fallback-spare', 'fallback-primary'))
+
     def test_get_breaker_status(self):
         """Test getting breaker status"""
         CircuitBreakerState.objects.create(
@@ -566,8 +656,44 @@ class CircuitBreakerManagerTestCase(TestCase):
         self.assertEqual(status['failure_count'], 2)
         self.assertEqual(status['is_healthy'], True)
 
+    def test_get_all_breaker_statuses_single_query(self):
+        """Test all statuses are built from one SELECT rather than a lookup per model"""
+        for index, state in enumerate(['closed', 'half_open', 'closed']):
+            CircuitBreakerState.objects.create(
+                model_name=f'bulk-status-model-{index}',
+                state=state,
+                failure_count=index
+            )
+
+        with self.assertNumQueries(1):
+            statuses = self.service.get_all_breaker_statuses()
+
+        self.assertEqual(statuses['bulk-status-model-1']['state'], 'half_open')
+        self.assertEqual(statuses['bulk-status-model-2']['failure_count'], 2)
+        self.assertEqual(statuses['bulk-status-model-0']['model_name'], 'bulk-status-model-0')
+
+    def test_get_failure_statistics_single_query(self):
+        """Test failure statistics are counted from one SELECT"""
+        now = timezone.now()
+        CircuitBreakerState.objects.create(model_name='stats-healthy', state='closed')
+        CircuitBreakerState.objects.create(model_name='stats-open', state='open', failure_count=5,
+                                           last_failure=now)
+        CircuitBreakerState.objects.create(model_name='stats-half-open', state='half_open', failure_count=3,
+                                           last_failure=now - timedelta(days=30))
+
+        with self.assertNumQueries(1):
+            stats = self.service.get_failure_statistics(days=7)
+
+        self.assertEqual(stats['total_models'], 3)
+        self.assertEqual(stats['models_with_failures'], 2)
+        self.assertEqual(stats['models_circuit_open'], 1)
+        self.assertEqual(stats['models_half_open'], 1)
+        self.assertEqual(stats['recent_failures'], 1)
+        self.assertEqual(stats['model_details']['stats-open']['uptime_status'], 'down')
+        self.assertEqual(stats['model_details']['stats-healthy']['uptime_status'], 'healthy')
+
 
-class ModelRegistryTestCase(TestCase):
+class ModelRegistryTestCase(SimpleTestCase):
     def setUp(self):
         self.registry = ModelRegistry()
 
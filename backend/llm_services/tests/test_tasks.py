@@ -22,7 +22,16 @@ User = get_user_model()
 
 
 class GenerateCVTaskTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Install the service patch once for the class; each test gets a fresh instance mock
+        cls.mock_service = cls.enterClassContext(patch('generation.tasks.EnhancedLLMService'))
+
     def setUp(self):
+        self.mock_service.reset_mock()
+        self.mock_service_instance = self.mock_service.return_value = Mock()
+
         self.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
@@ -54,13 +63,8 @@ class GenerateCVTaskTestCase(TestCase):
             technologies=["Python", "Django", "React"]
         )
 
-    @patch('generation.tasks.EnhancedLLMService')
-    def test_generate_cv_task_success(self, mock_service):
+    def test_generate_cv_task_success(self):
         """Test successful CV generation"""
-        # Mock the LLM service
-        mock_service_instance = Mock()
-        mock_service.return_value = mock_service_instance
-
         # Mock job description parsing (already parsed)
         self.job_description.parsed_data = {
             'must_have_skills': ['Python', 'Django'],
@@ -71,7 +75,7 @@ class GenerateCVTaskTestCase(TestCase):
         self.job_description.save()
 
         # Mock artifact ranking
-        mock_service_instance.rank_artifacts_by_relevance = AsyncMock(return_value=[
+        self.mock_service_instance.rank_artifacts_by_relevance = AsyncMock(return_value=[
             {
                 'id': self.artifact.id,
                 'title': 'My Resume',
@@ -81,7 +85,7 @@ class GenerateCVTaskTestCase(TestCase):
         ])
 
         # Mock CV generation
-        mock_service_instance.generate_cv_content = AsyncMock(return_value={
+        self.mock_service_instance.generate_cv_content = AsyncMock(return_value={
             'content': {
                 'professional_summary': 'Experienced software engineer...',
                 'key_skills': ['Python', 'Django', 'React'],
@@ -108,18 +112,45 @@ class GenerateCVTaskTestCase(TestCase):
         self.assertEqual(self.generation.model_version, 'gpt-4o')
         self.assertEqual(self.generation.generation_time_ms, 1500)
 
-    @patch('generation.tasks.EnhancedLLMService')
-    def test_generate_cv_task_parsing_needed(self, mock_service):
-        """Test CV generation when job description parsing is needed"""
-        mock_service_instance = Mock()
-        mock_service.return_value = mock_service_instance
+    def test_generate_cv_task_artifact_payload(self):
+        """Test artifacts are passed to ranking with their evidence links"""
+        EvidenceLink = apps.get_model('artifacts', 'EvidenceLink')
+        EvidenceLink.objects.create(
+            artifact=self.artifact,
+            url='https://github.com/test/repo',
+            link_type='github',
+            description='Source code'
+        )
+        self.job_description.parsed_data = {'must_have_skills': ['Python']}
+        self.job_description.save()
+
+        self.mock_service_instance.rank_artifacts_by_relevance = AsyncMock(return_value=[])
+        self.mock_service_instance.generate_cv_content = AsyncMock(return_value={
+            'content': {'professional_summary': 'Test summary'},
+            'processing_metadata': {'model_used': 'gpt-4o'}
+        })
 
+        generate_cv_task(self.generation.id)
+
+        artifacts_data = self.mock_service_instance.rank_artifacts_by_relevance.call_args[0][0]
+        self.assertEqual(len(artifacts_data), 1)
+        self.assertEqual(artifacts_data[0]['id'], self.artifact.id)
+        self.assertEqual(artifacts_data[0]['technologies'], ["Python", "Django", "React"])
+        self.assertIsNone(artifacts_data[0]['start_date'])
+        self.assertEqual(artifacts_data[0]['evidence_links'], [{
+            'url': 'https://github.com/test/repo',
+            'type': 'github',
+            'description': 'Source code'
+        }])
+
+    def test_generate_cv_task_parsing_needed(self):
+        """Test CV generation when job description parsing is needed"""
         # Job description not parsed yet
         self.job_description.parsed_data = {}
         self.job_description.save()
 
         # Mock job description parsing
-        mock_service_instance.parse_job_description = AsyncMock(return_value={
+        self.mock_service_instance.parse_job_description = AsyncMock(return_value={
             'company_name': 'Tech Corp',
             'role_title': 'Software Engineer',
             'must_have_skills': ['Python', 'Django'],
@@ -128,8 +159,8 @@ class GenerateCVTaskTestCase(TestCase):
         })
 
         # Mock other methods
-        mock_service_instance.rank_artifacts_by_relevance = AsyncMock(return_value=[])
-        mock_service_instance.generate_cv_content = AsyncMock(return_value={
+        self.mock_service_instance.rank_artifacts_by_relevance = AsyncMock(return_value=[])
+        self.mock_service_instance.generate_cv_content = AsyncMock(return_value={
             'content': {'professional_summary': 'Test summary'},
             'processing_metadata': {'model_used': 'gpt-4o', 'cost_usd': 0.005}
         })
@@ -146,14 +177,10 @@ class GenerateCVTaskTestCase(TestCase):
         self.generation.refresh_from_db()
         self.assertEqual(self.generation.status, 'completed')
 
-    @patch('generation.tasks.EnhancedLLMService')
-    def test_generate_cv_task_parsing_error(self, mock_service):
+    def test_generate_cv_task_parsing_error(self):
         """Test CV generation with job parsing error"""
-        mock_service_instance = Mock()
-        mock_service.return_value = mock_service_instance
-
         # Mock parsing failure
-        mock_service_instance.parse_job_description = AsyncMock(return_value={
+        self.mock_service_instance.parse_job_description = AsyncMock(return_value={
             'error': 'Failed to parse job description'
         })
 
@@ -165,19 +192,15 @@ class GenerateCVTaskTestCase(TestCase):
         self.assertEqual(self.generation.status, 'failed')
         self.assertIn('Failed to parse job description', self.generation.error_message)
 
-    @patch('generation.tasks.EnhancedLLMService')
-    def test_generate_cv_task_generation_error(self, mock_service):
+    def test_generate_cv_task_generation_error(self):
         """Test CV generation with content generation error"""
-        mock_service_instance = Mock()
-        mock_service.return_value = mock_service_instance
-
         # Job description already parsed
         self.job_description.parsed_data = {'must_have_skills': ['Python']}
         self.job_description.save()
 
         # Mock successful ranking but failed generation
-        mock_service_instance.rank_artifacts_by_relevance = AsyncMock(return_value=[])
-        mock_service_instance.generate_cv_content = AsyncMock(return_value={
+        self.mock_service_instance.rank_artifacts_by_relevance = AsyncMock(return_value=[])
+        self.mock_service_instance.generate_cv_content = AsyncMock(return_value={
             'error': 'Generation failed'
         })
 
@@ -263,6 +286,32 @@ class GenerateJobEmbeddingCacheTestCase(TestCase):
         self.assertIn('error', result)
         self.assertIn('Embedding failed', result['error'])
 
+    @patch('generation.tasks.FlexibleEmbeddingService')
+    def test_generate_job_embedding_cache_hit_skips_service(self, mock_service):
+        """Test cached job embedding short-circuits before the embedding service"""
+        from llm_services.models import JobDescriptionEmbedding
+        from llm_services.services.embedding_service import compute_job_hash
+
+        job_hash = compute_job_hash("Software engineer at Tech Corp", "Tech Corp", "Software Engineer")
+        JobDescriptionEmbedding.objects.create(
+            user=self.user,
+            job_description_hash=job_hash,
+            company_name='Tech Corp',
+            role_title='Software Engineer',
+            embedding_vector=[0.0] * 1536
+        )
+
+        result = generate_job_embedding_cache(
+            job_description="Software engineer at Tech Corp",
+            company_name="Tech Corp",
+            role_title="Software Engineer",
+            user_id=self.user.id
+        )
+
+        self.assertEqual(result, {'job_hash': job_hash, 'cached': True})
+        mock_service.assert_not_called()
+        self.assertEqual(JobDescriptionEmbedding.objects.get(job_description_hash=job_hash).access_count, 2)
+
 
 class EnhanceArtifactWithLLMTestCase(TestCase):
     def setUp(self):
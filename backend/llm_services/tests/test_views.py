@@ -11,7 +11,6 @@ from django.urls import reverse
 from django.utils import timezone
 from rest_framework.test import APITestCase
 from rest_framework import status
-from rest_framework_simplejwt.tokens import RefreshToken
 
 from ..models import (
     ModelPerformanceMetric,
@@ -21,6 +20,7 @@ from ..models import (
     EnhancedArtifact,
     ArtifactChunk
 )
+from accounts.tests.utils import auth_header_for
 
 User = get_user_model()
 
@@ -39,13 +39,6 @@ class BaseAPITestCase(APITestCase):
             is_staff=True
         )
 
-        # Create JWT tokens
-        refresh = RefreshToken.for_user(self.user)
-        self.user_token = str(refresh.access_token)
-
-        staff_refresh = RefreshToken.for_user(self.staff_user)
-        self.staff_token = str(staff_refresh.access_token)
-
     def get_unique_model_name(self, base_name='gpt-4o'):
         """Generate unique model name for each test class"""
         class_name = self.__class__.__name__
@@ -53,11 +46,11 @@ class BaseAPITestCase(APITestCase):
 
     def authenticate_user(self):
         """Authenticate as regular user"""
-        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.user_token}')
+        self.client.credentials(HTTP_AUTHORIZATION=auth_header_for(self.user))
 
     def authenticate_staff(self):
         """Authenticate as staff user"""
-        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.staff_token}')
+        self.client.credentials(HTTP_AUTHORIZATION=auth_header_for(self.staff_user))
 
 
 class ModelPerformanceMetricViewSetTestCase(BaseAPITestCase):
@@ -110,6 +103,21 @@ class ModelPerformanceMetricViewSetTestCase(BaseAPITestCase):
         self.assertIn('gpt-4o', model_names)
         self.assertIn('gpt-4o-mini', model_names)
 
+    def test_list_metrics_loads_only_user_email(self):
+        """Test the owner's email is joined in without loading the rest of the user row"""
+        self.authenticate_staff()
+        # User lookup, page count and page rows; no per-row user query
+        with self.assertNumQueries(3) as ctx:
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        emails = {result['model_name']: result['user_email'] for result in response.data['results']}
+        self.assertEqual(emails['gpt-4o'], 'test@example.com')
+        self.assertEqual(emails['gpt-4o-mini'], 'staff@example.com')
+        page_sql = ctx.captured_queries[-1]['sql']
+        self.assertIn('"email"', page_sql)
+        self.assertNotIn('"password"', page_sql)
+
     def test_list_metrics_unauthenticated(self):
         """Test listing metrics without authentication"""
         response = self.client.get(self.url)
@@ -357,33 +365,43 @@ class EnhancedArtifactViewSetTestCase(BaseAPITestCase):
             chunk_index=0,
             content='Chunk 1 content',
             content_hash='hash1',
-            embedding_vector=[0.0] * 1536  # Required for pgvector
+            embedding_vector=[0.0] * 1536,  # Required for pgvector
+            processing_cost_usd=Decimal('0.002')
         )
         ArtifactChunk.objects.create(
             artifact=self.artifact,
             chunk_index=1,
             content='Chunk 2 content',
             content_hash='hash2',
-            embedding_vector=[0.0] * 1536  # Required for pgvector
+            embedding_vector=[0.0] * 1536,  # Required for pgvector
+            processing_cost_usd=Decimal('0.003')
         )
 
     def test_list_enhanced_artifacts(self):
         """Test listing enhanced artifacts"""
         self.authenticate_user()
-        response = self.client.get(self.url)
+        # User lookup, page count and page rows with chunk costs summed in; no per-row aggregate
+        with self.assertNumQueries(3) as ctx:
+            response = self.client.get(self.url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data['results']), 1)
         self.assertEqual(response.data['results'][0]['title'], 'Test Resume')
+        self.assertAlmostEqual(response.data['results'][0]['total_processing_cost'], 0.005)
+        self.assertNotIn('"content_embedding"', ctx.captured_queries[-1]['sql'])
 
     def test_get_artifact_chunks(self):
         """Test getting chunks for an artifact"""
         self.authenticate_user()
         url = reverse('llm_services:enhanced-artifacts-chunks', kwargs={'pk': self.artifact.id})
-        response = self.client.get(url)
+        # User lookup, artifact and chunks; no per-chunk artifact query for artifact_title
+        with self.assertNumQueries(3) as ctx:
+            response = self.client.get(url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 2)
+        self.assertEqual(response.data[0]['artifact_title'], 'Test Resume')
+        self.assertNotIn('embedding', ctx.captured_queries[-1]['sql'])
         self.assertEqual(response.data[0]['chunk_index'], 0)
         self.assertEqual(response.data[1]['chunk_index'], 1)
 
@@ -534,13 +552,18 @@ class SystemHealthViewTestCase(BaseAPITestCase):
         # Mock cache miss
         mock_cache_get.return_value = None
 
+        CircuitBreakerState.objects.create(model_name='recovering-model', state='half_open')
+
         self.authenticate_user()
-        response = self.client.get(self.url)
+        # User lookup, one breaker aggregate and one metrics aggregate
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['healthy_models'], 1)
-        self.assertEqual(response.data['unhealthy_models'], 1)
+        self.assertEqual(response.data['unhealthy_models'], 2)
         self.assertEqual(response.data['circuit_breakers_open'], 1)
+        self.assertEqual(response.data['success_rate'], 100)
         self.assertIn('total_cost_today', response.data)
         self.assertIn('avg_response_time_ms', response.data)
         self.assertIn('success_rate', response.data)
@@ -14,7 +14,6 @@ from django.core.cache import cache
 from .models import (
     ModelPerformanceMetric,
     EnhancedArtifact,
-    ArtifactChunk,
     JobDescriptionEmbedding,
     ModelCostTracking,
     CircuitBreakerState
@@ -41,6 +40,15 @@ class StandardResultsSetPagination(PageNumberPagination):
     max_page_size = 100
 
 
+def _select_user_email(queryset):
+    """
+    Join the owning user for the serializers' ``user_email`` field, loading only
+    the email column of the user row instead of the whole row.
+    """
+    own_fields = [field.name for field in queryset.model._meta.concrete_fields]
+    return queryset.select_related('user').only(*own_fields, 'user__email')
+
+
 class ModelPerformanceMetricViewSet(viewsets.ReadOnlyModelViewSet):
     """
     ViewSet for viewing model performance metrics.
@@ -52,7 +60,7 @@ class ModelPerformanceMetricViewSet(viewsets.ReadOnlyModelViewSet):
     ordering = ['-created_at']
 
     def get_queryset(self):
-        queryset = ModelPerformanceMetric.objects.select_related('user')
+        queryset = _select_user_email(ModelPerformanceMetric.objects.all())
 
         # Filter by user if not staff
         if not self.request.user.is_staff:
@@ -162,7 +170,7 @@ class ModelCostTrackingViewSet(viewsets.ReadOnlyModelViewSet):
     ordering = ['-date']
 
     def get_queryset(self):
-        queryset = ModelCostTracking.objects.select_related('user')
+        queryset = _select_user_email(ModelCostTracking.objects.all())
 
         # Filter by user if not staff
         if not self.request.user.is_staff:
@@ -201,7 +209,7 @@ class JobDescriptionEmbeddingViewSet(viewsets.ReadOnlyModelViewSet):
     ordering = ['-last_accessed']
 
     def get_queryset(self):
-        queryset = JobDescriptionEmbedding.objects.select_related('user')
+        queryset = _select_user_email(JobDescriptionEmbedding.objects.all())
 
         # Filter by user if not staff
         if not self.request.user.is_staff:
@@ -252,7 +260,13 @@ class EnhancedArtifactViewSet(viewsets.ReadOnlyModelViewSet):
     ordering = ['-updated_at']
 
     def get_queryset(self):
-        queryset = EnhancedArtifact.objects.select_related('user').prefetch_related('chunks')
+        # Chunk costs are summed in the same query; the chunks themselves are never serialized.
+        # The embeddings are write-only in the serializer, so they are not read either.
+        queryset = _select_user_email(EnhancedArtifact.objects.all()).defer(
+            'content_embedding', 'summary_embedding'
+        ).annotate(
+            chunk_cost_sum=Sum('chunks__processing_cost_usd')
+        )
 
         # Filter by user if not staff
         if not self.request.user.is_staff:
@@ -264,7 +278,9 @@ class EnhancedArtifactViewSet(viewsets.ReadOnlyModelViewSet):
     def chunks(self, request, pk=None):
         """Get chunks for a specific artifact"""
         artifact = self.get_object()
-        chunks = ArtifactChunk.objects.filter(artifact=artifact).order_by('chunk_index')
+        # The related manager hands each chunk the artifact for artifact_title, and the
+        # write-only embedding vectors stay in the database
+        chunks = artifact.chunks.defer('embedding_vector').order_by('chunk_index')
         serializer = ArtifactChunkSerializer(chunks, many=True)
         return Response(serializer.data)
 
@@ -382,21 +398,31 @@ def system_health(request):
 
     try:
         # Circuit breaker health
-        breakers = CircuitBreakerState.objects.all()
-        healthy_models = breakers.filter(state='closed').count()
-        unhealthy_models = breakers.exclude(state='closed').count()
-        circuit_breakers_open = breakers.filter(state='open').count()
+        # One row per model, so a single conditional aggregate covers every state
+        breaker_counts = CircuitBreakerState.objects.aggregate(
+            healthy=Count('pk', filter=Q(state='closed')),
+            unhealthy=Count('pk', filter=~Q(state='closed')),
+            open=Count('pk', filter=Q(state='open')),
+        )
+        healthy_models = breaker_counts['healthy']
+        unhealthy_models = breaker_counts['unhealthy']
+        circuit_breakers_open = breaker_counts['open']
 
         # Today's costs and performance
         today = timezone.now().date()
-        today_metrics = ModelPerformanceMetric.objects.filter(created_at__date=today)
+        today_stats = ModelPerformanceMetric.objects.filter(created_at__date=today).aggregate(
+            total_cost=Sum('cost_usd'),
+            avg_time=Avg('processing_time_ms'),
+            total=Count('pk'),
+            successful=Count('pk', filter=Q(success=True)),
+        )
 
-        total_cost_today = today_metrics.aggregate(sum=Sum('cost_usd'))['sum'] or 0
-        avg_response_time = today_metrics.aggregate(avg=Avg('processing_time_ms'))['avg'] or 0
+        total_cost_today = today_stats['total_cost'] or 0
+        avg_response_time = today_stats['avg_time'] or 0
 
         # Success rate calculation
-        total_requests = today_metrics.count()
-        successful_requests = today_metrics.filter(success=True).count()
+        total_requests = today_stats['total']
+        successful_requests = today_stats['successful']
         success_rate = (successful_requests / total_requests * 100) if total_requests > 0 else 100
 
         health_data = {